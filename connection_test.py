@@ -7,6 +7,7 @@ Tests the improved connection logic with retry mechanisms.
 import asyncio
 import logging
 import sys
+from typing import Final
 from bleak import BleakClient, BleakScanner
 import bleak.exc
 
@@ -17,6 +18,10 @@ logging.basicConfig(
 )
 _LOGGER = logging.getLogger(__name__)
 
+# Alta 80 status request, parsed once at import
+STATUS_COMMAND_HEX: Final = "FEFE03010200"
+STATUS_COMMAND: Final[bytes] = bytes.fromhex(STATUS_COMMAND_HEX)
+
 DEVICE_NAME = "gzf1-80-F14D2A"  # Update this to your device name
 
 async def enhanced_device_scan(device_name: str, max_attempts: int = 2):
@@ -160,11 +165,9 @@ async def test_communication(client):
         await asyncio.sleep(0.5)
         
         # Send command with retry
-        command_bytes = bytes.fromhex("FEFE03010200")
-        
         for cmd_attempt in range(2):
-            _LOGGER.info(f"📤 Sending command attempt {cmd_attempt + 1}: FEFE03010200")
-            await client.write_gatt_char(write_char, command_bytes)
+            _LOGGER.info(f"📤 Sending command attempt {cmd_attempt + 1}: {STATUS_COMMAND_HEX}")
+            await client.write_gatt_char(write_char, STATUS_COMMAND)
             
             # Wait for initial response
             initial_count = response_count
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager
 import logging
 from typing import Optional
 
@@ -33,6 +34,8 @@ class GoalZeroBLEManager:
         self._reconnect_task: Optional[asyncio.Task] = None
         self._should_maintain_connection = True
         self._connection_lost_callback = None
+        self._gatt_services: Optional[dict] = None
+        self._cmd_cache: dict[str, bytes] = {}
         
         _LOGGER.debug(
             "Initialized BLE manager for %s (%s) with persistent connection support",
@@ -90,6 +93,7 @@ class GoalZeroBLEManager:
                 
             _LOGGER.debug("Attempting to connect to %s (%s)", self._device.name, self.address)
             self._client = BleakClient(self._device, disconnected_callback=self._on_disconnect)
+            self._gatt_services = None
             
             # Use asyncio.wait_for with proper timeout handling
             await asyncio.wait_for(
@@ -116,6 +120,17 @@ class GoalZeroBLEManager:
             self._client = None
             return False
 
+    @asynccontextmanager
+    async def session(self):
+        """Bring the link up for a burst of commands and reads.
+        
+        The persistent connection keeps the link open between sessions;
+        raises ConnectionError if the device cannot be reached.
+        """
+        if not await self.ensure_connected():
+            raise ConnectionError(f"Failed to connect to {self.address}")
+        yield self
+
     async def disconnect(self) -> None:
         """Disconnect from the BLE device."""
         async with self._connection_lock:
@@ -132,6 +147,13 @@ class GoalZeroBLEManager:
                     self._connected = False
                     _LOGGER.info("Disconnected from device %s", self.address)
 
+    def _command_bytes(self, command_hex: str) -> bytes:
+        """Return the bytes for a hex command string, parsing each string once."""
+        command_bytes = self._cmd_cache.get(command_hex)
+        if command_bytes is None:
+            command_bytes = self._cmd_cache[command_hex] = bytes.fromhex(command_hex)
+        return command_bytes
+
     async def send_command(self, command_data: str | bytes) -> bool:
         """Send a command to the device using dynamic GATT discovery.
         
@@ -148,7 +170,7 @@ class GoalZeroBLEManager:
             return False
         try:
             if isinstance(command_data, str):
-                command_bytes = bytes.fromhex(command_data)
+                command_bytes = self._command_bytes(command_data)
                 command_hex = command_data
             else:
                 command_bytes = command_data
@@ -177,10 +199,8 @@ class GoalZeroBLEManager:
                 return False
             _LOGGER.info("[BLEManager] Command sent successfully to %s: %s", self.address, command_hex)
             return True
-        except Exception as e:
-            _LOGGER.error("[BLEManager] Failed to send command to %s: %s", self.address, e)
-            import traceback
-            _LOGGER.error("[BLEManager] Traceback: %s", traceback.format_exc())
+        except Exception:
+            _LOGGER.exception("[BLEManager] Failed to send command to %s", self.address)
             return False
 
     async def _find_write_characteristic(self):
@@ -269,7 +289,7 @@ class GoalZeroBLEManager:
             await self._client.start_notify(read_char, handle_notification)
 
             # Send command
-            command_bytes = bytes.fromhex(command_hex)
+            command_bytes = self._command_bytes(command_hex)
             await self._client.write_gatt_char(write_char, command_bytes)
             _LOGGER.debug("Sent command to %s: %s", self.address, command_hex)
 
@@ -298,40 +318,46 @@ class GoalZeroBLEManager:
             _LOGGER.error("Not connected to device %s for GATT discovery", self.address)
             return {}
 
+        if self._gatt_services is not None:
+            return self._gatt_services
+
         try:
-            services_info = {}
-            services = self._client.services
-            
-            _LOGGER.info("=== GATT Discovery for %s ===", self.address)
-            for service in services.services.values():
-                service_info = {
-                    "uuid": str(service.uuid),
-                    "characteristics": []
+            str_uuid = str
+            services_info = {
+                str_uuid(service.uuid): {
+                    "uuid": str_uuid(service.uuid),
+                    "characteristics": [
+                        {
+                            "uuid": str_uuid(char.uuid),
+                            "handle": f"0x{char.handle:04X}",
+                            "properties": tuple(char.properties),
+                            "descriptors": [
+                                {"uuid": str_uuid(d.uuid), "handle": d.handle}
+                                for d in char.descriptors
+                            ],
+                        }
+                        for char in service.characteristics
+                    ],
                 }
-                
-                _LOGGER.info("Service: %s", service.uuid)
-                for char in service.characteristics:
-                    char_info = {
-                        "uuid": str(char.uuid),
-                        "handle": f"0x{char.handle:04X}",
-                        "properties": [prop for prop in char.properties]
-                    }
-                    service_info["characteristics"].append(char_info)
-                    
+                for service in self._client.services.services.values()
+            }
+
+            _LOGGER.info("=== GATT Discovery for %s ===", self.address)
+            for service_uuid, service_info in services_info.items():
+                _LOGGER.info("Service: %s", service_uuid)
+                for char_info in service_info["characteristics"]:
                     _LOGGER.info(
-                        "  Characteristic: %s (Handle: 0x%04X, Properties: %s)", 
-                        char.uuid, char.handle, char.properties
+                        "  Characteristic: %s (Handle: %s, Properties: %s)",
+                        char_info["uuid"], char_info["handle"], char_info["properties"]
                     )
-                    
-                    for descriptor in char.descriptors:
+                    for descriptor in char_info["descriptors"]:
                         _LOGGER.info(
-                            "    Descriptor: %s (Handle: 0x%04X)", 
-                            descriptor.uuid, descriptor.handle
+                            "    Descriptor: %s (Handle: 0x%04X)",
+                            descriptor["uuid"], descriptor["handle"]
                         )
-                
-                services_info[str(service.uuid)] = service_info
-            
             _LOGGER.info("=== End GATT Discovery ===")
+
+            self._gatt_services = services_info
             return services_info
             
         except Exception as e:
@@ -365,10 +391,8 @@ class GoalZeroBLEManager:
             else:
                 _LOGGER.error("[BLEManager] Command send failed for %s!", device_name)
             return result
-        except Exception as e:
-            _LOGGER.error("[BLEManager] Exception sending command to device %s: %s", device_name, e)
-            import traceback
-            _LOGGER.error("[BLEManager] Traceback: %s", traceback.format_exc())
+        except Exception:
+            _LOGGER.exception("[BLEManager] Exception sending command to device %s", device_name)
             return False
 
     async def start_persistent_connection(self) -> bool:
@@ -464,14 +488,7 @@ class GoalZeroBLEManager:
             
         try:
             # Find characteristic by handle
-            char = None
-            for service in self._client.services.services.values():
-                for characteristic in service.characteristics:
-                    if characteristic.handle == handle:
-                        char = characteristic
-                        break
-                if char:
-                    break
+            char = self._client.services.get_characteristic(handle)
                     
             if not char:
                 _LOGGER.error("Characteristic with handle 0x%04X not found", handle)
@@ -508,14 +525,7 @@ class GoalZeroBLEManager:
             
         try:
             # Find characteristic by handle
-            char = None
-            for service in self._client.services.services.values():
-                for characteristic in service.characteristics:
-                    if characteristic.handle == handle:
-                        char = characteristic
-                        break
-                if char:
-                    break
+            char = self._client.services.get_characteristic(handle)
                     
             if not char:
                 _LOGGER.error("Characteristic with handle 0x%04X not found", handle)
@@ -28,21 +28,18 @@ async def async_setup_entry(
     
     # Get button definitions from device
     device = coordinator.device
-    if hasattr(device, 'get_buttons'):
-        button_definitions = device.get_buttons()
-        
-        for button_def in button_definitions:
-            entities.append(
-                GoalZeroButton(
-                    coordinator,
-                    button_def["key"],
-                    button_def["name"],
-                    button_def.get("icon"),
-                )
+    for button_def in device.buttons:
+        entities.append(
+            GoalZeroButton(
+                coordinator,
+                button_def["key"],
+                button_def["name"],
+                button_def.get("icon"),
             )
+        )
     
     if entities:
-        async_add_entities(entities, update_before_add=True)
+        async_add_entities(entities)
 
 
 class GoalZeroButton(GoalZeroEntity, ButtonEntity):
@@ -104,5 +101,5 @@ class GoalZeroButton(GoalZeroEntity, ButtonEntity):
             else:
                 _LOGGER.error("[BUTTON] Failed to execute button %s", self._key)
                 
-        except Exception as e:
-            _LOGGER.error("Error pressing button %s: %s", self._key, e)
+        except Exception:
+            _LOGGER.exception("[BUTTON] Error pressing button %s", self._key)
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 import logging
 from datetime import timedelta
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -33,6 +36,10 @@ class GoalZeroCoordinator(DataUpdateCoordinator):
         self.address = config_entry.data["address"]
         self.device_type = config_entry.data["device_type"]
         
+        # Shared prefixes for entity unique IDs and names
+        self.unique_id_prefix = f"{self.address}_"
+        self.name_prefix = f"{self.device_name} "
+        
         update_interval = config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         
         super().__init__(
@@ -50,12 +57,23 @@ class GoalZeroCoordinator(DataUpdateCoordinator):
         if not self.device:
             raise ValueError(f"Failed to create device for type: {self.device_type}")
         
+        # Device info is shared read-only by every entity of this device
+        self.device_info = MappingProxyType(self.device.device_info)
+        
+        # Device capabilities, resolved once instead of on every command
+        self.supports_switch_state = callable(getattr(self.device, 'set_switch_state', None))
+        self.supports_switches = callable(getattr(self.device, 'create_switch_command', None))
+        
         # Initialize BLE manager
         self.ble_manager = GoalZeroBLEManager(self.address, self.device_type)
         
         # Track GATT discovery for debugging
         self._gatt_discovery_done = False
         
+        # Entity commands are queued so bursts share one BLE session and one state push
+        self._command_queue: asyncio.Queue = asyncio.Queue()
+        self._command_task: asyncio.Task | None = None
+        
         # Flag to track if we've done GATT discovery for debugging
         self._gatt_discovery_done = False
         
@@ -141,6 +159,90 @@ class GoalZeroCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error sending custom command to %s: %s", self.device_name, e)
             return False
 
+    async def enqueue_command(
+        self,
+        key: str,
+        send: Callable[[], Awaitable[bool]],
+        updates: dict[str, Any],
+    ) -> bool:
+        """Queue an entity command and wait for its result.
+
+        Commands queued for the same key before the worker picks them up are
+        coalesced (last write wins). On success, ``updates`` is merged into the
+        coordinator data without polling the device again.
+        """
+        if self._command_task is None or self._command_task.done():
+            self._start_command_worker()
+        
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._command_queue.put_nowait((key, send, updates, future))
+        return await future
+
+    def _start_command_worker(self) -> None:
+        """Start the command worker as a task owned by the config entry."""
+        self._command_task = self.config_entry.async_create_background_task(
+            self.hass, self._process_commands(), f"{DOMAIN}_{self.device_name}_commands"
+        )
+
+    def _fail_queued_commands(self) -> None:
+        """Resolve every command still waiting in the queue as failed."""
+        while not self._command_queue.empty():
+            *_, future = self._command_queue.get_nowait()
+            if not future.done():
+                future.set_result(False)
+
+    async def _process_commands(self) -> None:
+        """Send queued commands in batches and publish their state once per batch."""
+        try:
+            while True:
+                batch: dict[str, tuple[Callable[[], Awaitable[bool]], dict[str, Any], list]] = {}
+                item = await self._command_queue.get()
+                while True:
+                    key, send, updates, future = item
+                    # Last write wins; earlier callers for the same key share its result
+                    _, _, futures = batch.pop(key, (None, None, []))
+                    futures.append(future)
+                    batch[key] = (send, updates, futures)
+                    if self._command_queue.empty():
+                        break
+                    item = self._command_queue.get_nowait()
+                
+                try:
+                    await self._send_batch(batch)
+                except Exception:
+                    _LOGGER.exception("Error processing commands for %s", self.device_name)
+                finally:
+                    # Whatever the batch did not resolve (error or cancel) failed
+                    for _, _, futures in batch.values():
+                        for future in futures:
+                            if not future.done():
+                                future.set_result(False)
+        finally:
+            self._fail_queued_commands()
+
+    async def _send_batch(
+        self, batch: dict[str, tuple[Callable[[], Awaitable[bool]], dict[str, Any], list]]
+    ) -> None:
+        """Send one batch of commands over a single BLE session."""
+        new_data: dict[str, Any] = {}
+        async with self.ble_manager.session():
+            for key, (send, updates, futures) in batch.items():
+                try:
+                    success = await send()
+                except Exception:
+                    _LOGGER.exception("Error sending %s command to %s", key, self.device_name)
+                    success = False
+                if success:
+                    new_data.update(updates)
+                for future in futures:
+                    if not future.done():
+                        future.set_result(success)
+        
+        # Skip the listener fan-out when the device already reported these values
+        current = self.data or {}
+        if any(k not in current or current[k] != v for k, v in new_data.items()):
+            self.async_set_updated_data({**current, **new_data})
+
     def get_sensor_value(self, sensor_key: str):
         """Get current sensor value."""
         if self.data and self.device:
@@ -151,6 +253,16 @@ class GoalZeroCoordinator(DataUpdateCoordinator):
         """Shutdown the coordinator and stop persistent connection."""
         _LOGGER.info("Shutting down coordinator for %s", self.device_name)
         
+        # Stop the command worker
+        if self._command_task and not self._command_task.done():
+            self._command_task.cancel()
+            try:
+                await self._command_task
+            except asyncio.CancelledError:
+                pass
+        # A worker cancelled before it ever ran leaves its queue behind
+        self._fail_queued_commands()
+        
         # Stop persistent connection
         if hasattr(self.ble_manager, 'stop_persistent_connection'):
             await self.ble_manager.stop_persistent_connection()
@@ -159,13 +271,6 @@ class GoalZeroCoordinator(DataUpdateCoordinator):
         if self.ble_manager and hasattr(self.ble_manager, 'disconnect'):
             await self.ble_manager.disconnect()
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        if self.device:
-            return self.device.device_info
-        return None
-
     @property
     def is_connected(self) -> bool:
         """Return connection status."""
@@ -178,5 +283,8 @@ class GoalZeroCoordinator(DataUpdateCoordinator):
             _LOGGER.info("Starting persistent BLE connection for %s", self.device_name)
             await self.ble_manager.start_persistent_connection()
         
+        # Start the command worker
+        self._start_command_worker()
+        
         # Perform first data update
         await self.async_refresh()
@@ -13,6 +13,15 @@ from ..const import DEVICE_TYPE_ALTA80, ALTA_80_MODEL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bytes to exclude from raw entity creation (replaced with rich entities)
+_EXCLUDED_BYTES = frozenset({0, 1, 6, 7, 8, 9, 10, 14, 15, 18, 26, 27, 35})
+
+# Temperature sensors need dynamic units
+_TEMPERATURE_SENSORS = frozenset({
+    "left_zone_temperature", "right_zone_temperature",
+    "max_setpoint_temperature", "min_setpoint_temperature",
+})
+
 
 class Alta80Device(GoalZeroDevice):
     """Goal Zero Alta 80 fridge system device."""
@@ -31,13 +40,10 @@ class Alta80Device(GoalZeroDevice):
         """Return list of sensor definitions for this device."""
         sensors = []
         
-        # Bytes to exclude from raw entity creation (replaced with rich entities)
-        excluded_bytes = {0, 1, 6, 7, 8, 9, 10, 14, 15, 18, 26, 27, 35}
-        
         # Create dual entities for remaining bytes (0-35) - measurement and discrete versions
         # Based on updated byte mapping from protocol analysis
         for i in range(36):
-            if i not in excluded_bytes:
+            if i not in _EXCLUDED_BYTES:
                 # Regular entity for line graphs
                 sensors.append({
                     "key": f"status_byte_{i}",
@@ -45,7 +51,8 @@ class Alta80Device(GoalZeroDevice):
                     "device_class": None,
                     "state_class": SensorStateClass.MEASUREMENT,
                     "unit": None,
-                    "icon": "mdi:database"
+                    "icon": "mdi:database",
+                    "byte_index": i,
                 })
                 
                 # Discrete entity for bar charts
@@ -55,7 +62,8 @@ class Alta80Device(GoalZeroDevice):
                     "device_class": None,
                     "state_class": None,
                     "unit": None,
-                    "icon": "mdi:chart-bar"
+                    "icon": "mdi:chart-bar",
+                    "byte_index": i,
                 })
         
         # Rich temperature and control sensors
@@ -208,13 +216,7 @@ class Alta80Device(GoalZeroDevice):
         """Get dynamic configuration for sensor entities based on current device state."""
         config = {}
         
-        # Temperature sensors need dynamic units
-        temp_sensors = {
-            "left_zone_temperature", "right_zone_temperature",
-            "max_setpoint_temperature", "min_setpoint_temperature"
-        }
-        
-        if self._data and key in temp_sensors:
+        if self._data and key in _TEMPERATURE_SENSORS:
             temp_unit = self._data.get("temperature_unit", "°F")
             config["unit"] = UnitOfTemperature.FAHRENHEIT if temp_unit == "°F" else UnitOfTemperature.CELSIUS
             _LOGGER.debug("Dynamic config for %s: unit=%s", key, config["unit"])
@@ -242,22 +244,19 @@ class Alta80Device(GoalZeroDevice):
                     # Use longer timeout for device discovery
                     devices = await BleakScanner.discover(timeout=20.0)
                     
-                    found_devices = []
                     for device in devices:
-                        if device.name:
-                            found_devices.append(f"{device.name} ({device.address})")
-                            if device.name == self.name:
-                                device_obj = device  # Store the device object, not just address
-                                _LOGGER.info("✓ Found target device: %s (%s) on attempt %d", 
-                                           device.name, device.address, scan_attempt + 1)
-                                break
+                        if device.name == self.name:
+                            device_obj = device  # Store the device object, not just address
+                            _LOGGER.info("✓ Found target device: %s (%s) on attempt %d", 
+                                       device.name, device.address, scan_attempt + 1)
+                            break
                     
                     if device_obj:
                         break
                         
                     if scan_attempt == 0:
-                        _LOGGER.warning("Device %s not found on first scan. Found devices: %s", 
-                                      self.name, ", ".join(found_devices[:5]))  # Show first 5
+                        _LOGGER.warning("Device %s not found on first scan", self.name)
+                        self._log_found_devices(devices)
                         _LOGGER.info("Retrying scan in 3 seconds...")
                         await asyncio.sleep(3)  # Longer pause before retry
                         
@@ -278,6 +277,15 @@ class Alta80Device(GoalZeroDevice):
             self._data = self._get_default_data()
             return self._data
 
+    @staticmethod
+    def _log_found_devices(devices) -> None:
+        """Log the named devices seen during a failed scan (debug only)."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Available devices: %s",
+                [f"{device.name} ({device.address})" for device in devices if device.name],
+            )
+
     async def _connect_and_read_data(self, device_obj, max_retries: int = 2) -> dict[str, Any]:
         """Connect to device and read data with retry logic."""
         from bleak import BleakClient
@@ -531,13 +539,10 @@ class Alta80Device(GoalZeroDevice):
         """Return default data structure with None values."""
         data = {}
         
-        # Bytes to exclude from raw entity creation (replaced with rich entities)
-        excluded_bytes = {0, 1, 6, 7, 8, 9, 10, 14, 15, 18, 26, 27, 35}
-        
         # Initialize remaining status bytes to None
         # Create both regular and discrete versions for each byte
         for i in range(36):
-            if i not in excluded_bytes:
+            if i not in _EXCLUDED_BYTES:
                 data[f"status_byte_{i}"] = None
                 data[f"status_byte_{i}_discrete"] = None
         
@@ -581,9 +586,6 @@ class Alta80Device(GoalZeroDevice):
             
             _LOGGER.debug("Parsing %d total bytes from concatenated response", len(all_bytes))
             
-            # Bytes to exclude from raw entity creation (replaced with rich entities)
-            excluded_bytes = {0, 1, 6, 7, 8, 9, 10, 14, 15, 18, 26, 27, 35}
-            
             # First pass: detect temperature unit from byte 14
             temp_unit = "°F"  # Default
             temp_unit_code = 0xFE
@@ -605,7 +607,7 @@ class Alta80Device(GoalZeroDevice):
             for i, byte_val in enumerate(all_bytes):
                 if i < 36:  # Exactly 36 bytes in response
                     # Store remaining raw bytes (excluding rich entity bytes)
-                    if i not in excluded_bytes:
+                    if i not in _EXCLUDED_BYTES:
                         parsed_data[f"status_byte_{i}"] = byte_val
                         parsed_data[f"status_byte_{i}_discrete"] = byte_val
                     
@@ -893,10 +895,8 @@ class Alta80Device(GoalZeroDevice):
             else:
                 _LOGGER.error("[Alta80] Command send failed!")
             return success
-        except Exception as e:
-            _LOGGER.error("[Alta80] Exception sending command: %s", e)
-            import traceback
-            _LOGGER.error("[Alta80] Traceback: %s", traceback.format_exc())
+        except Exception:
+            _LOGGER.exception("[Alta80] Exception sending command")
             return False
     
     # Command generation methods for entity platforms
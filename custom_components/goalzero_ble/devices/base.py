@@ -3,6 +3,9 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.helpers.entity import DeviceInfo
@@ -66,6 +69,33 @@ class GoalZeroDevice(ABC):
         # Default implementation - override in device classes that support numbers
         return []
 
+    # Entity definitions are fixed per device; build them once and share read-only views
+
+    @cached_property
+    def sensors(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the sensor definitions as an immutable, cached tuple."""
+        return tuple(MappingProxyType(sensor) for sensor in self.get_sensors())
+
+    @cached_property
+    def buttons(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the button definitions as an immutable, cached tuple."""
+        return tuple(MappingProxyType(button) for button in self.get_buttons())
+
+    @cached_property
+    def switches(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the switch definitions as an immutable, cached tuple."""
+        return tuple(MappingProxyType(switch) for switch in self.get_switches())
+
+    @cached_property
+    def selects(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the select definitions as an immutable, cached tuple."""
+        return tuple(MappingProxyType(select) for select in self.get_selects())
+
+    @cached_property
+    def numbers(self) -> tuple[Mapping[str, Any], ...]:
+        """Return the number definitions as an immutable, cached tuple."""
+        return tuple(MappingProxyType(number) for number in self.get_numbers())
+
     @abstractmethod
     async def update_data(self, ble_manager) -> dict[str, Any]:
         """Update device data from BLE connection."""
@@ -1,6 +1,7 @@
 """Number platform for Goal Zero BLE devices."""
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any
 
@@ -16,6 +17,12 @@ from .entity import GoalZeroEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number keys whose current value is stored under a different data key
+_NUMBER_DATA_KEYS = {
+    "zone1_setpoint": "zone_1_setpoint",
+    "zone2_setpoint": "zone_2_setpoint",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,26 +36,23 @@ async def async_setup_entry(
     
     # Get number definitions from device
     device = coordinator.device
-    if hasattr(device, 'get_numbers'):
-        number_definitions = device.get_numbers()
-        
-        for number_def in number_definitions:
-            entities.append(
-                GoalZeroNumberEntity(
-                    coordinator,
-                    number_def["key"],
-                    number_def["name"],
-                    number_def.get("icon"),
-                    number_def.get("min_value", 0),
-                    number_def.get("max_value", 100),
-                    number_def.get("step", 1),
-                    number_def.get("unit"),
-                    number_def.get("mode", NumberMode.AUTO),
-                )
+    for number_def in device.numbers:
+        entities.append(
+            GoalZeroNumberEntity(
+                coordinator,
+                number_def["key"],
+                number_def["name"],
+                number_def.get("icon"),
+                number_def.get("min_value", 0),
+                number_def.get("max_value", 100),
+                number_def.get("step", 1),
+                number_def.get("unit"),
+                number_def.get("mode", NumberMode.AUTO),
             )
+        )
     
     if entities:
-        async_add_entities(entities, update_before_add=True)
+        async_add_entities(entities)
 
 
 class GoalZeroNumberEntity(GoalZeroEntity, NumberEntity):
@@ -73,6 +77,9 @@ class GoalZeroNumberEntity(GoalZeroEntity, NumberEntity):
         self._attr_native_step = step
         self._base_unit = unit
         self._attr_mode = mode
+        self._data_key = _NUMBER_DATA_KEYS.get(key, key)
+        # Encoded set commands, reused for repeated slider values
+        self._commands: dict[float, bytes] = {}
 
     @property
     def native_min_value(self) -> float:
@@ -114,51 +121,47 @@ class GoalZeroNumberEntity(GoalZeroEntity, NumberEntity):
     def native_value(self) -> float | None:
         """Return the current value."""
         # Get current setpoint value from device data
-        if self.coordinator.data:
-            if self._key == "zone1_setpoint":
-                return self.coordinator.data.get("zone_1_setpoint")
-            elif self._key == "zone2_setpoint":
-                return self.coordinator.data.get("zone_2_setpoint")
-            else:
-                return self.coordinator.data.get(self._key)
+        data = self.coordinator.data
+        if data:
+            return data.get(self._data_key)
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value."""
-        _LOGGER.info("[NUMBER] User setting value '%.1f' for number '%s'", value, self._key)
+        _LOGGER.debug("[NUMBER] User setting value '%.1f' for number '%s'", value, self._key)
         try:
-            device = self.coordinator.device
-            ble_manager = self.coordinator.ble_manager
-            _LOGGER.info("[NUMBER] Device type: %s", type(device).__name__)
-            
-            success = False
+            coordinator = self.coordinator
+            device = coordinator.device
+            ble_manager = coordinator.ble_manager
             
             # Check if device has set_number_value method (for Yeti 500)
             if hasattr(device, 'set_number_value'):
-                _LOGGER.info("[NUMBER] Using set_number_value method")
-                success = await device.set_number_value(ble_manager, self._key, value)
+                send = partial(device.set_number_value, ble_manager, self._key, value)
             
             # Fallback to create_number_set_command method (for other devices)
             elif hasattr(device, 'create_number_set_command'):
-                _LOGGER.info("[NUMBER] Device has create_number_set_command method")
-                command = device.create_number_set_command(self._key, value)
-                _LOGGER.info("[NUMBER] Generated command: %s (%d bytes)", command.hex(':'), len(command))
-                success = await device.send_command(ble_manager, command)
+                command = self._commands.get(value)
+                if command is None:
+                    command = self._commands[value] = device.create_number_set_command(self._key, value)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "[NUMBER] %s command for %s: %s (%d bytes)",
+                        type(device).__name__, self._key, command.hex(':'), len(command),
+                    )
+                send = partial(device.send_command, ble_manager, command)
             else:
                 _LOGGER.error("[NUMBER] Device does not support number commands")
                 return
-                
+            
+            # The coordinator batches commands and pushes the new value on success
+            success = await coordinator.enqueue_command(self._key, send, {self._data_key: value})
             if success:
                 _LOGGER.info("[NUMBER] Successfully set %s to %.1f", self._key, value)
-                # Request immediate refresh to update the state
-                await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("[NUMBER] Failed to set %s to %.1f", self._key, value)
                 
-        except Exception as e:
-            _LOGGER.error("[NUMBER] Error setting number %s to %.1f: %s", self._key, value, e)
-            import traceback
-            _LOGGER.error("[NUMBER] Traceback: %s", traceback.format_exc())
+        except Exception:
+            _LOGGER.exception("[NUMBER] Error setting number %s to %.1f", self._key, value)
 
     @property
     def available(self) -> bool:
@@ -1,7 +1,9 @@
 """Select platform for Goal Zero BLE integration."""
 from __future__ import annotations
 
+from functools import partial
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
@@ -15,6 +17,24 @@ from .entity import GoalZeroEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Battery protection values as reported by the device (raw or display form)
+_BP_RAW_TO_DISPLAY = {
+    "low": "Low",
+    "med": "Medium",
+    "medium": "Medium",
+    "high": "High",
+    "Low": "Low",
+    "Medium": "Medium",
+    "High": "High",
+}
+
+# Battery protection display values to command values
+_BP_DISPLAY_TO_RAW = {
+    "Low": "low",
+    "Medium": "med",
+    "High": "high",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,22 +48,19 @@ async def async_setup_entry(
     
     # Get select definitions from device
     device = coordinator.device
-    if hasattr(device, 'get_selects'):
-        select_definitions = device.get_selects()
-        
-        for select_def in select_definitions:
-            entities.append(
-                GoalZeroSelect(
-                    coordinator,
-                    select_def["key"],
-                    select_def["name"],
-                    select_def.get("icon"),
-                    select_def["options"],
-                )
+    for select_def in device.selects:
+        entities.append(
+            GoalZeroSelect(
+                coordinator,
+                select_def["key"],
+                select_def["name"],
+                select_def.get("icon"),
+                select_def["options"],
             )
+        )
     
     if entities:
-        async_add_entities(entities, update_before_add=True)
+        async_add_entities(entities)
 
 
 class GoalZeroSelect(GoalZeroEntity, SelectEntity):
@@ -55,11 +72,14 @@ class GoalZeroSelect(GoalZeroEntity, SelectEntity):
         key: str,
         name: str,
         icon: str | None,
-        options: list[str],
+        options: list[str] | tuple[str, ...],
     ) -> None:
         """Initialize the select."""
         super().__init__(coordinator, key, name, icon)
-        self._attr_options = options
+        # Options never change after setup; keep them immutable and interned
+        self._attr_options = tuple(sys.intern(option) for option in options)
+        # Resolve the device capability once instead of on every selection
+        self._create_cmd = getattr(coordinator.device, 'create_select_command', None)
 
     @property
     def current_option(self) -> str | None:
@@ -69,59 +89,41 @@ class GoalZeroSelect(GoalZeroEntity, SelectEntity):
                 # Map internal value to display value
                 raw_value = self.coordinator.data.get("battery_protection", "low")
                 if isinstance(raw_value, str):
-                    value_map = {
-                        "low": "Low",
-                        "med": "Medium", 
-                        "medium": "Medium",
-                        "high": "High"
-                    }
-                    return value_map.get(raw_value.lower(), "Low")
+                    return _BP_RAW_TO_DISPLAY.get(raw_value, "Low")
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        _LOGGER.info("[SELECT] User selected option '%s' for select '%s'", option, self._key)
+        _LOGGER.debug("[SELECT] User selected option '%s' for select '%s'", option, self._key)
         try:
             device = self.coordinator.device
-            _LOGGER.info("[SELECT] Device type: %s", type(device).__name__)
             
-            if hasattr(device, 'create_select_command'):
-                _LOGGER.info("[SELECT] Device has create_select_command method")
-                
+            if self._create_cmd is not None:
                 # Map display value to internal value
                 if self._key == "battery_protection":
-                    option_map = {
-                        "Low": "low",
-                        "Medium": "med",
-                        "High": "high"
-                    }
-                    internal_value = option_map.get(option, "low")
-                    _LOGGER.debug("[SELECT] Mapped option '%s' to internal value '%s'", option, internal_value)
+                    internal_value = _BP_DISPLAY_TO_RAW.get(option, "low")
                 else:
                     internal_value = option.lower()
-                    _LOGGER.debug("[SELECT] Using lowercase option: '%s'", internal_value)
                 
-                _LOGGER.debug("[SELECT] Creating select command for key '%s' with value '%s'", self._key, internal_value)
-                command = device.create_select_command(self._key, internal_value)
-                _LOGGER.info("[SELECT] Generated command: %s (%d bytes)", command.hex(':'), len(command))
+                command = self._create_cmd(self._key, internal_value)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "[SELECT] %s command for %s=%s: %s (%d bytes)",
+                        type(device).__name__, self._key, internal_value, command.hex(':'), len(command),
+                    )
                 
                 ble_manager = self.coordinator.ble_manager
-                _LOGGER.info("[SELECT] BLE manager type: %s", type(ble_manager).__name__)
-                
-                _LOGGER.debug("[SELECT] Sending command via device.send_command...")
-                success = await device.send_command(ble_manager, command)
+                # The coordinator batches commands and pushes the new state on success
+                success = await self.coordinator.enqueue_command(
+                    self._key, partial(device.send_command, ble_manager, command), {self._key: option}
+                )
                 
                 if success:
                     _LOGGER.info("[SELECT] Command sent successfully for %s", self._key)
-                    await self.coordinator.async_request_refresh()
-                    _LOGGER.debug("[SELECT] Requested coordinator refresh after successful command")
                 else:
                     _LOGGER.error("[SELECT] Command send failed for %s", self._key)
             else:
                 _LOGGER.error("[SELECT] Device does not support select commands (missing create_select_command)")
                 
-        except Exception as e:
-            _LOGGER.error("[SELECT] Exception setting select %s to %s: %s", self._key, option, e)
-            _LOGGER.error("[SELECT] Exception type: %s", type(e).__name__)
-            import traceback
-            _LOGGER.error("[SELECT] Full traceback: %s", traceback.format_exc())
+        except Exception:
+            _LOGGER.exception("[SELECT] Exception setting select %s to %s", self._key, option)
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -29,31 +30,15 @@ async def async_setup_entry(
         return
 
     # Get sensor definitions from device
-    sensor_definitions = coordinator.device.get_sensors()
+    sensor_definitions = coordinator.device.sensors
     
     # Create sensor entities - filter out byte sensors that aren't being used
-    entities = []
-    for sensor_def in sensor_definitions:
-        # For status byte sensors, only create them if they have data or are decoded sensors
-        sensor_key = sensor_def["key"]
-        if sensor_key.startswith("status_byte_"):
-            # Handle both regular and discrete byte sensors
-            if "_discrete" in sensor_key:
-                # Extract byte number from "status_byte_X_discrete"
-                byte_num_str = sensor_key.split("_")[2]  # Get the X from status_byte_X_discrete
-            else:
-                # Extract byte number from "status_byte_X"
-                byte_num_str = sensor_key.split("_")[-1]  # Get the X from status_byte_X
-                
-            try:
-                byte_num = int(byte_num_str)
-                if byte_num < 36:  # Exactly 36 bytes (0-35) in Alta 80 response
-                    entities.append(GoalZeroSensor(coordinator, sensor_def))
-            except ValueError:
-                _LOGGER.error("Could not parse byte number from sensor key: %s", sensor_key)
-        else:
-            # Always create non-byte sensors (decoded values, etc.)
-            entities.append(GoalZeroSensor(coordinator, sensor_def))
+    # Status byte sensors carry their byte index; Alta 80 responses are exactly 36 bytes (0-35)
+    entities = [
+        GoalZeroSensor(coordinator, sensor_def)
+        for sensor_def in sensor_definitions
+        if sensor_def.get("byte_index", 0) < 36
+    ]
     
     _LOGGER.info("Setting up %d sensors for %s", len(entities), coordinator.device_name)
     async_add_entities(entities)
@@ -62,17 +47,19 @@ async def async_setup_entry(
 class GoalZeroSensor(CoordinatorEntity, SensorEntity):
     """Goal Zero BLE sensor."""
 
-    def __init__(self, coordinator: GoalZeroCoordinator, sensor_definition: dict[str, Any]) -> None:
+    # State comes from the coordinator; never poll entities individually
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: GoalZeroCoordinator, sensor_definition: Mapping[str, Any]) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         
-        self.coordinator = coordinator
         self.sensor_def = sensor_definition
         self._sensor_key = sensor_definition["key"]
         
         # Set up entity attributes
-        self._attr_unique_id = f"{coordinator.address}_{self._sensor_key}"
-        self._attr_name = f"{coordinator.device_name} {sensor_definition['name']}"
+        self._attr_unique_id = coordinator.unique_id_prefix + self._sensor_key
+        self._attr_name = coordinator.name_prefix + sensor_definition["name"]
         self._attr_device_class = sensor_definition.get("device_class")
         self._attr_state_class = sensor_definition.get("state_class")
         self._attr_icon = sensor_definition.get("icon")
@@ -82,6 +69,9 @@ class GoalZeroSensor(CoordinatorEntity, SensorEntity):
         
         # Device info
         self._attr_device_info = coordinator.device_info
+        
+        # Availability only changes when the coordinator publishes an update
+        self._cached_available = self._compute_available()
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -105,6 +95,16 @@ class GoalZeroSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
+        return self._cached_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability before writing the new state."""
+        self._cached_available = self._compute_available()
+        super()._handle_coordinator_update()
+
+    def _compute_available(self) -> bool:
+        """Compute availability from the coordinator state."""
         # For Alta 80 devices that connect/disconnect for each update,
         # availability is based only on last update success
         if self.coordinator.device_type == DEVICE_TYPE_ALTA80:
@@ -116,28 +116,25 @@ class GoalZeroSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        attrs = {
-            "device_type": self.coordinator.device_type,
-        }
-        
-        # Add last update time if available
-        if hasattr(self.coordinator, 'last_update_success_time'):
-            attrs["last_update"] = self.coordinator.last_update_success_time
-        elif hasattr(self.coordinator, 'last_update_time'):
-            attrs["last_update"] = self.coordinator.last_update_time
+        # Only the diagnostic sensors carry per-update attributes; the device
+        # type is already on the device entry
+        key = self._sensor_key
+        is_status_byte = key[:12] == "status_byte_"
+        if not is_status_byte and key != "concatenated_response":
+            return None
         
-        # Add raw sensor value if different from native_value
-        raw_value = self.coordinator.get_sensor_value(self._sensor_key)
-        if raw_value is not None:
-            attrs["raw_value"] = raw_value
+        raw_value = self.coordinator.get_sensor_value(key)
+        if raw_value is None:
+            return None
+        attrs: dict[str, Any] = {"raw_value": raw_value}
         
-        # For byte sensors, add hex representation
-        if self._sensor_key.startswith("status_byte_") and raw_value is not None:
+        if is_status_byte:
+            # For byte sensors, add hex representation
             attrs["hex_value"] = f"0x{raw_value:02X}"
-            
-        # For concatenated response, add length info
-        if self._sensor_key == "concatenated_response" and raw_value:
-            attrs["response_length_chars"] = len(str(raw_value))
-            attrs["response_length_bytes"] = len(str(raw_value)) // 2
+        elif raw_value:
+            # For concatenated response, add length info
+            length = len(str(raw_value))
+            attrs["response_length_chars"] = length
+            attrs["response_length_bytes"] = length // 2
             
         return attrs
@@ -1,6 +1,7 @@
 """Switch platform for Goal Zero BLE integration."""
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any
 
@@ -15,6 +16,12 @@ from .entity import GoalZeroEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Legacy data keys for switches whose state predates per-key reporting
+_SWITCH_DATA_KEYS = {
+    "power": "power_on",
+    "eco_mode": "eco_mode",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,25 +31,15 @@ async def async_setup_entry(
     """Set up Goal Zero BLE switches."""
     coordinator: GoalZeroCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
-    
     # Get switch definitions from device
-    device = coordinator.device
-    if hasattr(device, 'get_switches'):
-        switch_definitions = device.get_switches()
-        
-        for switch_def in switch_definitions:
-            entities.append(
-                GoalZeroSwitch(
-                    coordinator,
-                    switch_def["key"],
-                    switch_def["name"],
-                    switch_def.get("icon"),
-                )
-            )
-    
-    if entities:
-        async_add_entities(entities, update_before_add=True)
+    switch_definitions = coordinator.device.switches
+    if switch_definitions:
+        async_add_entities(
+            [
+                GoalZeroSwitch(coordinator, d["key"], d["name"], d.get("icon"))
+                for d in switch_definitions
+            ]
+        )
 
 
 class GoalZeroSwitch(GoalZeroEntity, SwitchEntity):
@@ -57,93 +54,71 @@ class GoalZeroSwitch(GoalZeroEntity, SwitchEntity):
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, key, name, icon)
+        self._data_key = _SWITCH_DATA_KEYS.get(key, key)
+        # Encoded on/off commands; the bytes depend only on key and state
+        self._commands: dict[bool, bytes] = {}
 
     @property
     def is_on(self) -> bool | None:
         """Return True if entity is on."""
-        if self.coordinator.data:
-            # Check if there's a direct mapping for this switch key
-            switch_value = self.coordinator.data.get(self._key)
-            if switch_value is not None:
-                return bool(switch_value)
-            
-            # Legacy mappings for backward compatibility
-            if self._key == "power":
-                return self.coordinator.data.get("power_on", False)
-            elif self._key == "eco_mode":
-                return self.coordinator.data.get("eco_mode", False)
+        data = self.coordinator.data
+        if not data:
+            return None
+        
+        # Check if there's a direct mapping for this switch key
+        value = data.get(self._key)
+        if value is not None:
+            return bool(value)
+        
+        # Legacy switches read their older key and report off until it is set
+        if self._key in _SWITCH_DATA_KEYS:
+            return bool(data.get(self._data_key, False))
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        _LOGGER.info("[SWITCH] User turning ON switch '%s'", self._key)
-        try:
-            device = self.coordinator.device
-            ble_manager = self.coordinator.ble_manager
-            _LOGGER.info("[SWITCH] Device type: %s", type(device).__name__)
-            
-            success = False
-            
-            # Check if device has set_switch_state method (for Yeti 500)
-            if hasattr(device, 'set_switch_state'):
-                _LOGGER.info("[SWITCH] Using set_switch_state method")
-                success = await device.set_switch_state(ble_manager, self._key, True)
-            
-            # Fallback to create_switch_command method (for other devices)
-            elif hasattr(device, 'create_switch_command'):
-                _LOGGER.info("[SWITCH] Device has create_switch_command method")
-                command = device.create_switch_command(self._key, True)
-                _LOGGER.info("[SWITCH] Generated command: %s (%d bytes)", command.hex(':'), len(command))
-                success = await device.send_command(ble_manager, command)
-            else:
-                _LOGGER.error("[SWITCH] Device does not support switch commands")
-                return
-                
-            if success:
-                _LOGGER.info("[SWITCH] Successfully turned on %s", self._key)
-                # Request immediate refresh to update the state
-                await self.coordinator.async_request_refresh()
-            else:
-                _LOGGER.error("[SWITCH] Failed to turn on %s", self._key)
-                
-        except Exception as e:
-            _LOGGER.error("[SWITCH] Error turning on switch %s: %s", self._key, e)
-            import traceback
-            _LOGGER.error("[SWITCH] Traceback: %s", traceback.format_exc())
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        _LOGGER.info("[SWITCH] User turning OFF switch '%s'", self._key)
+        await self._async_set(False)
+
+    async def _async_set(self, state: bool) -> None:
+        """Send the switch command for the requested state."""
+        action = "on" if state else "off"
+        _LOGGER.debug("[SWITCH] User turning %s switch '%s'", action.upper(), self._key)
         try:
-            device = self.coordinator.device
-            ble_manager = self.coordinator.ble_manager
-            _LOGGER.info("[SWITCH] Device type: %s", type(device).__name__)
-            
-            success = False
+            coordinator = self.coordinator
+            device = coordinator.device
+            ble_manager = coordinator.ble_manager
             
             # Check if device has set_switch_state method (for Yeti 500)
-            if hasattr(device, 'set_switch_state'):
-                _LOGGER.info("[SWITCH] Using set_switch_state method")
-                success = await device.set_switch_state(ble_manager, self._key, False)
+            if coordinator.supports_switch_state:
+                send = partial(device.set_switch_state, ble_manager, self._key, state)
             
             # Fallback to create_switch_command method (for other devices)
-            elif hasattr(device, 'create_switch_command'):
-                _LOGGER.info("[SWITCH] Device has create_switch_command method")
-                command = device.create_switch_command(self._key, False)
-                _LOGGER.info("[SWITCH] Generated command: %s (%d bytes)", command.hex(':'), len(command))
-                success = await device.send_command(ble_manager, command)
+            elif coordinator.supports_switches:
+                command = self._commands.get(state)
+                if command is None:
+                    command = self._commands[state] = device.create_switch_command(self._key, state)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "[SWITCH] %s command for %s: %s (%d bytes)",
+                        type(device).__name__, self._key, command.hex(':'), len(command),
+                    )
+                send = partial(device.send_command, ble_manager, command)
             else:
                 _LOGGER.error("[SWITCH] Device does not support switch commands")
                 return
-                
+            
+            # The coordinator batches commands and pushes the new state on success,
+            # under whichever key is_on reads it from
+            data_key = self._key if self._key in (coordinator.data or {}) else self._data_key
+            success = await coordinator.enqueue_command(self._key, send, {data_key: state})
             if success:
-                _LOGGER.info("[SWITCH] Successfully turned off %s", self._key)
-                # Request immediate refresh to update the state
-                await self.coordinator.async_request_refresh()
+                _LOGGER.info("[SWITCH] Successfully turned %s %s", action, self._key)
             else:
-                _LOGGER.error("[SWITCH] Failed to turn off %s", self._key)
+                _LOGGER.error("[SWITCH] Failed to turn %s %s", action, self._key)
                 
-        except Exception as e:
-            _LOGGER.error("[SWITCH] Error turning off switch %s: %s", self._key, e)
-            import traceback
-            _LOGGER.error("[SWITCH] Traceback: %s", traceback.format_exc())
+        except Exception:
+            _LOGGER.exception("[SWITCH] Error turning %s switch %s", action, self._key)
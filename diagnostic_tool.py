@@ -7,7 +7,9 @@ This script helps debug connection and GATT issues.
 import asyncio
 import logging
 import sys
+from typing import Final
 from bleak import BleakClient, BleakScanner
+from bleak.backends.device import BLEDevice
 
 # Set up logging
 logging.basicConfig(
@@ -16,180 +18,282 @@ logging.basicConfig(
 )
 _LOGGER = logging.getLogger(__name__)
 
+# Alta 80 status request, parsed once at import
+STATUS_COMMAND_HEX: Final = "FEFE03010200"
+STATUS_COMMAND: Final[bytes] = bytes.fromhex(STATUS_COMMAND_HEX)
+STATUS_RESPONSE_LEN: Final = 36
 
-async def scan_for_devices():
-    """Scan for Goal Zero devices."""
+# Advertised name prefixes of supported Goal Zero devices
+_GZ_PREFIXES = ("gzf1-80-", "gzy5c-")
+
+# Address -> (write handle, notify handle) resolved on a previous connection.
+# Handles rather than UUIDs: several Goal Zero characteristics share a UUID,
+# and characteristic objects are invalidated on disconnect.
+_CHAR_CACHE: dict[str, tuple[int, int]] = {}
+
+
+# Goal Zero devices don't advertise a service UUID we can filter on, so use a
+# BlueZ name-prefix Pattern instead ("gz" covers both gzf1-80- and gzy5c-).
+# Other backends ignore these args; the Python-side name checks stay as the
+# authoritative filter since controller-side filtering can be unreliable.
+def _bluez_filter_args(pattern: str) -> dict:
+    """Return BlueZ scanner args that drop non-matching advertisements early."""
+    return {"filters": {"Pattern": pattern, "DuplicateData": False}}
+
+
+class _DeviceLogger(logging.LoggerAdapter):
+    """Prefix log lines with the device being diagnosed."""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['device']}] {msg}", kwargs
+
+
+async def scan_for_devices(expected: int | None = None, timeout: float = 10.0, grace: float = 2.0):
+    """Scan for Goal Zero devices.
+    
+    Stops as soon as `expected` devices have been seen, or `grace` seconds
+    after the first one when no count is given; `timeout` is the upper bound.
+    """
     _LOGGER.info("Scanning for Goal Zero devices...")
-    devices = await BleakScanner.discover(timeout=10.0)
+    found = {}
+    found_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    
+    def detection_callback(device, advertisement_data):
+        if device.address in found:
+            return
+        if not (name := device.name) or not name.startswith(_GZ_PREFIXES):
+            return
+        found[device.address] = device
+        _LOGGER.info(f"Found Goal Zero device: {name} ({device.address})")
+        if expected is not None:
+            if len(found) >= expected:
+                found_event.set()
+        elif len(found) == 1:
+            # Give other nearby devices a moment to advertise
+            loop.call_later(grace, found_event.set)
     
-    goalzero_devices = []
-    for device in devices:
-        if device.name and ('gzf1-80-' in device.name or 'gzy5c-' in device.name):
-            goalzero_devices.append(device)
-            _LOGGER.info(f"Found Goal Zero device: {device.name} ({device.address})")
+    async with BleakScanner(detection_callback=detection_callback, bluez=_bluez_filter_args("gz")):
+        try:
+            await asyncio.wait_for(found_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
-    return goalzero_devices
+    return list(found.values())
 
 
-async def diagnose_device(device_address: str | None = None, device_name: str | None = None):
-    """Perform diagnostic tests on a specific device."""
-    _LOGGER.info(f"Starting diagnostics for {device_name or device_address}")
+async def resolve_device(device_address: str | None, device_name: str | None, log=_LOGGER):
+    """Look up a device for the CLI entry points, by name or by address."""
+    device_obj = None
+    
+    if device_name:
+        log.info("Scanning for device by name...")
+        found_event = asyncio.Event()
+        
+        def detection_callback(device, advertisement_data):
+            nonlocal device_obj
+            if device_obj is None and device.name == device_name:
+                device_obj = device
+                found_event.set()
+        
+        async with BleakScanner(
+            detection_callback=detection_callback, bluez=_bluez_filter_args(device_name)
+        ):
+            try:
+                await asyncio.wait_for(found_event.wait(), timeout=15.0)
+            except asyncio.TimeoutError:
+                pass
+        
+        if device_obj:
+            log.info(f"✓ Found device by name: {device_obj.name} ({device_obj.address})")
+    elif device_address:
+        log.info("Finding device by address...")
+        device_obj = await BleakScanner.find_device_by_address(device_address, timeout=15.0)
+        if device_obj:
+            log.info(f"✓ Found device by address: {device_obj.name or 'Unknown'} ({device_obj.address})")
+    
+    return device_obj
+
+
+async def diagnose_device(
+    device_obj: BLEDevice | None = None,
+    device_address: str | None = None,
+    device_name: str | None = None,
+):
+    """Perform diagnostic tests on a specific device.
+    
+    Pass `device_obj` when the device was already resolved by a scan; the
+    name/address lookup is only used when nothing was pre-scanned.
+    """
+    if device_obj is not None:
+        device_name = device_obj.name
+        device_address = device_obj.address
+    log = _DeviceLogger(_LOGGER, {"device": device_name or device_address})
+    log.info("Starting diagnostics")
     
     try:
-        # If we have device_name, scan for it; if we have address, find device by address
-        device_obj = None
-        
-        if device_name:
-            _LOGGER.info("Scanning for device by name...")
-            devices = await BleakScanner.discover(timeout=15.0)
-            for device in devices:
-                if device.name == device_name:
-                    device_obj = device
-                    _LOGGER.info(f"✓ Found device by name: {device.name} ({device.address})")
-                    break
-        elif device_address:
-            _LOGGER.info("Finding device by address...")
-            device_obj = await BleakScanner.find_device_by_address(device_address, timeout=15.0)
-            if device_obj:
-                _LOGGER.info(f"✓ Found device by address: {device_obj.name or 'Unknown'} ({device_obj.address})")
+        if device_obj is None:
+            device_obj = await resolve_device(device_address, device_name, log)
         
         if not device_obj:
-            _LOGGER.error(f"✗ Device not found")
+            log.error(f"✗ Device not found")
             return
         
         # Test connection using device object
-        _LOGGER.info("Testing connection...")
+        log.info("Testing connection...")
         async with BleakClient(device_obj, timeout=15.0) as client:
-            _LOGGER.info(f"✓ Successfully connected to {device_obj.address}")
+            log.info(f"✓ Successfully connected to {device_obj.address}")
             
             # Discover services
-            _LOGGER.info("Discovering GATT services...")
+            log.info("Discovering GATT services...")
             services = client.services
             
-            _LOGGER.info("=== GATT Services ===")
-            for service in services.services.values():
-                _LOGGER.info(f"Service: {service.uuid}")
-                for char in service.characteristics:
-                    _LOGGER.info(
-                        f"  Characteristic: {char.uuid} (Handle: 0x{char.handle:04X}, Properties: {char.properties})"
-                    )
-                    for descriptor in char.descriptors:
-                        _LOGGER.info(f"    Descriptor: {descriptor.uuid} (Handle: 0x{descriptor.handle:04X})")
+            if log.isEnabledFor(logging.INFO):
+                log.info("=== GATT Services ===")
+                for service in services.services.values():
+                    log.info("Service: %s", service.uuid)
+                    for char in service.characteristics:
+                        log.info(
+                            "  Characteristic: %s (Handle: 0x%04X, Properties: %s)",
+                            char.uuid, char.handle, char.properties,
+                        )
+                        for descriptor in char.descriptors:
+                            log.info("    Descriptor: %s (Handle: 0x%04X)", descriptor.uuid, descriptor.handle)
             
             # Test Alta 80 specific handles if this looks like an Alta 80
             if device_obj.name and 'gzf1-80-' in device_obj.name:
-                await test_alta80_communication(client)
+                await test_alta80_communication(client, log)
             
-        _LOGGER.info("✓ Diagnostic completed successfully")
+        log.info("✓ Diagnostic completed successfully")
         
     except asyncio.TimeoutError:
-        _LOGGER.error(f"✗ Connection timeout for {device_address}")
+        log.error(f"✗ Connection timeout for {device_address}")
     except Exception as e:
-        _LOGGER.error(f"✗ Error during diagnostics: {e}")
+        log.error(f"✗ Error during diagnostics: {e}")
 
 
-async def test_alta80_communication(client):
+async def test_alta80_communication(client, log=_LOGGER):
     """Test specific Alta 80 communication."""
-    _LOGGER.info("Testing Alta 80 specific communication...")
-    
-    # Find characteristics by properties instead of hardcoded handles
-    write_char = None
-    read_char = None
+    log.info("Testing Alta 80 specific communication...")
     
+    # Find characteristics by properties instead of hardcoded handles,
+    # reusing the handles resolved on an earlier connection when available
     services = client.services
-    _LOGGER.info("Discovering characteristics by properties...")
+    cached = _CHAR_CACHE.get(client.address)
+    if cached:
+        write_char = services.get_characteristic(cached[0])
+        read_char = services.get_characteristic(cached[1])
+    else:
+        write_char = None
+        read_char = None
     
-    for service in services.services.values():
-        for char in service.characteristics:
-            properties = char.properties
-            if 'write' in properties or 'write-without-response' in properties:
-                if not write_char:  # Take the first one found
-                    write_char = char
-                    _LOGGER.info(f"✓ Found write characteristic at handle 0x{char.handle:04X} with properties {properties}")
-            
-            if 'notify' in properties or 'indicate' in properties:
-                if not read_char:  # Take the first one found
-                    read_char = char
-                    _LOGGER.info(f"✓ Found notify characteristic at handle 0x{char.handle:04X} with properties {properties}")
+    if write_char and read_char:
+        log.info(f"✓ Using cached characteristics at handles 0x{cached[0]:04X}/0x{cached[1]:04X}")
+    else:
+        log.info("Discovering characteristics by properties...")
+        
+        # Take the first one found; each next() stops at its first match
+        write_char = next(
+            (
+                c for svc in services.services.values() for c in svc.characteristics
+                if 'write' in c.properties or 'write-without-response' in c.properties
+            ),
+            None,
+        )
+        read_char = next(
+            (
+                c for svc in services.services.values() for c in svc.characteristics
+                if 'notify' in c.properties or 'indicate' in c.properties
+            ),
+            None,
+        )
+        for label, char in (("write", write_char), ("notify", read_char)):
+            if char:
+                log.info(f"✓ Found {label} characteristic at handle 0x{char.handle:04X} with properties {char.properties}")
     
     if not write_char:
-        _LOGGER.error("✗ No write characteristic found")
+        log.error("✗ No write characteristic found")
         return
     
     if not read_char:
-        _LOGGER.error("✗ No notify characteristic found")
+        log.error("✗ No notify characteristic found")
         return
     
+    _CHAR_CACHE[client.address] = (write_char.handle, read_char.handle)
+    # Skip the ATT write ACK round-trip when the characteristic allows it
+    write_with_response = 'write-without-response' not in write_char.properties
+    
     # Test command sending with retry logic
     try:
-        responses = []
+        buf = bytearray()
         response_count = 0
+        got_response = asyncio.Event()
+        all_responses = asyncio.Event()
         
         def notification_handler(sender, data):
-            nonlocal response_count, responses
+            nonlocal response_count
             response_count += 1
-            hex_data = data.hex().upper()
-            _LOGGER.info(f"Response {response_count}: {hex_data}")
-            responses.append(hex_data)
+            # Keep the callback cheap; hex formatting happens once at the end
+            buf.extend(data)
+            log.info("Response %d: %d bytes", response_count, len(data))
+            got_response.set()
+            # Done once the payload is complete, however many notifications
+            # the negotiated MTU split it into
+            if len(buf) >= STATUS_RESPONSE_LEN:
+                all_responses.set()
         
         # Start notifications
         await client.start_notify(read_char, notification_handler)
-        _LOGGER.info("✓ Started notifications")
+        log.info("✓ Started notifications")
         
         # Wait for notifications to be set up
         await asyncio.sleep(0.5)
         
         # Send status command with retry logic
-        command_bytes = bytes.fromhex("FEFE03010200")
-        
         for attempt in range(2):
-            _LOGGER.info(f"✓ Sending status command attempt {attempt + 1}: FEFE03010200")
-            await client.write_gatt_char(write_char, command_bytes)
+            log.info(f"✓ Sending status command attempt {attempt + 1}: {STATUS_COMMAND_HEX}")
+            got_response.clear()
+            await client.write_gatt_char(write_char, STATUS_COMMAND, response=write_with_response)
             
             # Wait for initial response
-            initial_wait = 3
-            elapsed = 0
-            initial_response_count = response_count
-            
-            while response_count == initial_response_count and elapsed < initial_wait:
-                await asyncio.sleep(0.1)
-                elapsed += 0.1
+            try:
+                await asyncio.wait_for(got_response.wait(), timeout=3.0)
+            except asyncio.TimeoutError:
+                pass
             
-            if response_count > initial_response_count:
-                _LOGGER.info(f"✓ Got response on attempt {attempt + 1}")
+            if got_response.is_set():
+                log.info(f"✓ Got response on attempt {attempt + 1}")
                 break
             elif attempt == 0:
-                _LOGGER.warning("⚠ No response to first command, retrying...")
+                log.warning("⚠ No response to first command, retrying...")
                 await asyncio.sleep(1)
         
         # Wait for all responses
-        timeout_duration = 12
-        elapsed = 0
-        while response_count < 2 and elapsed < timeout_duration:
-            await asyncio.sleep(0.1)
-            elapsed += 0.1
+        try:
+            await asyncio.wait_for(all_responses.wait(), timeout=12.0)
+        except asyncio.TimeoutError:
+            pass
         
         await client.stop_notify(read_char)
-        _LOGGER.info("✓ Stopped notifications")
+        log.info("✓ Stopped notifications")
         
-        if response_count >= 2:
-            _LOGGER.info(f"✓ Received {response_count} responses as expected")
+        if buf:
+            log.info(f"✓ Received {response_count} responses")
             
-            # Concatenate and analyze
-            if len(responses) >= 2:
-                combined = responses[0] + responses[1]
-                _LOGGER.info(f"Combined response: {combined}")
-                _LOGGER.info(f"Combined length: {len(combined)//2} bytes")
-                
-                if len(combined) == 72:  # 36 bytes * 2 hex chars
-                    _LOGGER.info("✓ Response length matches expected 36 bytes")
-                else:
-                    _LOGGER.warning(f"⚠ Unexpected response length: {len(combined)//2} bytes (expected 36)")
+            # Analyze the accumulated payload
+            log.info("Combined response: %s (%d bytes)", buf.hex().upper(), len(buf))
+            
+            if len(buf) >= STATUS_RESPONSE_LEN:
+                log.info(f"✓ Response length covers expected {STATUS_RESPONSE_LEN} bytes")
+            else:
+                log.warning(
+                    f"⚠ Unexpected response length: {len(buf)} bytes (expected {STATUS_RESPONSE_LEN})"
+                )
         else:
-            _LOGGER.warning(f"⚠ Only received {response_count} responses (expected 2)")
+            log.warning("⚠ No responses received")
         
     except Exception as e:
-        _LOGGER.error(f"✗ Error testing communication: {e}")
+        log.error(f"✗ Error testing communication: {e}")
 
 
 async def main():
@@ -214,9 +318,23 @@ async def main():
             _LOGGER.warning("No Goal Zero devices found")
             return
         
-        for device in devices:
-            await diagnose_device(device_name=device.name)
-            print("-" * 50)
+        # Diagnose devices concurrently, capped to what an adapter handles reliably
+        connection_slots = asyncio.Semaphore(4)
+        
+        async def diagnose_limited(device):
+            async with connection_slots:
+                # Reuse the BLEDevice from the single scan above instead of re-scanning
+                await diagnose_device(device)
+        
+        results = await asyncio.gather(
+            *(diagnose_limited(device) for device in devices), return_exceptions=True
+        )
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    f"Diagnosis failed for {device.name} ({device.address}): {result}",
+                    exc_info=result,
+                )
 
 
 if __name__ == "__main__":
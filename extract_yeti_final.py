@@ -3,41 +3,17 @@
 Direct extraction of Yeti 500 response data from specific CSV lines.
 """
 
-import csv
-import re
-from typing import Dict, List, Any
+import sys
+from typing import Dict, Any
 
-def decode_ascii_hex(hex_string: str) -> str:
-    """Convert colon-separated ASCII hex values to readable text."""
-    if not hex_string:
-        return ""
-    
-    hex_string = hex_string.strip('"')
-    parts = hex_string.split(':')
-    result = ""
-    
-    for part in parts:
-        if len(part) == 1:
-            result += part
-        elif len(part) == 2:
-            try:
-                byte_val = int(part, 16)
-                if 32 <= byte_val <= 126:
-                    result += chr(byte_val)
-                else:
-                    result += f"[{part}]"
-            except ValueError:
-                result += part
-        else:
-            result += part
-    
-    return result
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
 
 def extract_device_response() -> Dict[str, Any]:
     """Extract device response data directly."""
-    # This is the decoded device response from line 8
-    device_text = '{"id"1,"src""gzy5c-d8132a74dbb4","result"{"body" {"_version"2,"fw""1.3.6","identity"{"thingName""gzy5c-d8132a74dbb4","local""gzy5c-74dbb4","lbl""","hostId""H-37000-A20-B1-C1","sn""37000-02-24D01034","mac""d8132a74dbb4"},"time"{"sys"1690000111,"up"111},"iot"{"ble"{"m"2,"rm"0,"c"1},"ap"{"m"2,"rm"0,"c"0},"sta"{"m"2,"rm"2,"wlan"{"s"0,"err"0,"ssid""G6Yeti","ip""","known"{"0"{"ssid""IronCanoe","conn"1749310809},"1"{"ssid""","conn"0},"2"{"ssid""","conn"0}}},"cloud"{"s"0,"err"0,"env""prod","mqtt""a1xyddj5i8k7t5-ats.iot.us-east-1.amazonaws.com","api""yeti-prod.goalzeroapp.com"}}},"act"{"s"0,"req"{"reboot"0,"reset"0,"chkUpd"0}},"iNodes"{"N-37000-A20-1"{"fw""2.0.6"},"N-37000-A20-2"{"fw""1.7.9"},"N-37000-B1-1"{"fw""0.5.8"},"N-37000-C1-1"{"fw""0.3.1"}},"batt"{"sn""IDU191GAPCM2403180006936","whCap"499}},"status_msg" "200 OK","status_code" 200,"id" 1}}'
-    
+    # Values taken from the decoded device response on line 8
     return {
         'method': 'device',
         'id': 1,
@@ -59,9 +35,7 @@ def extract_device_response() -> Dict[str, Any]:
 
 def extract_status_response() -> Dict[str, Any]:
     """Extract status response data directly."""
-    # This is the decoded status response from lines 15-16
-    status_text = '{"id"2,"src""gzy5c-d8132a74dbb4","result"{"body" {"_version"2,"shdw"{"config"1749217511,"device"1749217511,"ota"1749217512,"lifetime"1749217512},"wifiRssi"0,"appOn"0,"notify"[0,0],"batt"{"cyc"10,"soc"11,"whRem"57,"v"27.2,"aNetAvg"7.5,"aNet"7.7,"cTmp"36.8,"mTtef"125,"wNetAvg"203,"wNet"208,"pctHtsRh"0,"cHtsTmp"36.8,"whIn"4856,"whOut"0},"ports"{"acOut"{"s"0,"w"0,"v"0,"a"0},"v12Out"{"s"0,"w"0},"usbOut"{"s"0,"w"0},"acIn"{"s"2,"v"1175,"a"0.2,"w"287,"fastChg"0},"lvDcIn"{"s"0,"v"0,"a"0,"w"0}}},"status_msg" "200 OK","status_code" 200,"id" 2}}'
-    
+    # Values taken from the decoded status response on lines 15-16
     return {
         'method': 'status',
         'id': 2,
@@ -130,6 +104,83 @@ def extract_config_response() -> Dict[str, Any]:
         'firmware_auto_update': 24
     }
 
+# Entity identifiers are fixed; build them once as interned tuples
+_SENSORS = tuple(sys.intern(name) for name in (
+    # Battery sensors (primary status data)
+    'battery_state_of_charge',       # batt.soc (%)
+    'battery_remaining_wh',          # batt.whRem (Wh)
+    'battery_voltage',               # batt.v (V)
+    'battery_cycles',                # batt.cyc (count)
+    'battery_temperature',           # batt.cTmp (°C)
+    'battery_time_to_empty_minutes', # batt.mTtef (minutes)
+    'battery_input_wh',              # batt.whIn (Wh total)
+    'battery_output_wh',             # batt.whOut (Wh total)
+    
+    # Battery advanced sensors
+    'battery_current_net',           # batt.aNet (A)
+    'battery_current_net_avg',       # batt.aNetAvg (A)
+    'battery_power_net',             # batt.wNet (W)
+    'battery_power_net_avg',         # batt.wNetAvg (W)
+    'battery_heater_relative_humidity', # batt.pctHtsRh (%)
+    'battery_heater_temperature',    # batt.cHtsTmp (°C)
+    
+    # AC Output port sensors
+    'acOut_status',                  # ports.acOut.s (0=off, 1=on)
+    'acOut_watts',                   # ports.acOut.w (W)
+    'acOut_voltage',                 # ports.acOut.v (V)
+    'acOut_amperage',                # ports.acOut.a (A)
+    
+    # AC Input port sensors
+    'acIn_status',                   # ports.acIn.s (0=off, 1=standby, 2=charging)
+    'acIn_watts',                    # ports.acIn.w (W)
+    'acIn_voltage',                  # ports.acIn.v (V scaled by 10)
+    'acIn_amperage',                 # ports.acIn.a (A)
+    'acIn_fast_charging',            # ports.acIn.fastChg (0/1)
+    
+    # 12V Output port sensors
+    'v12Out_status',                 # ports.v12Out.s (0=off, 1=on)
+    'v12Out_watts',                  # ports.v12Out.w (W)
+    
+    # USB Output port sensors
+    'usbOut_status',                 # ports.usbOut.s (0=off, 1=on)
+    'usbOut_watts',                  # ports.usbOut.w (W)
+    
+    # Low Voltage DC Input sensors
+    'lvDcIn_status',                 # ports.lvDcIn.s (0=off, 1=on)
+    'lvDcIn_watts',                  # ports.lvDcIn.w (W)
+    'lvDcIn_voltage',                # ports.lvDcIn.v (V)
+    'lvDcIn_amperage',               # ports.lvDcIn.a (A)
+    
+    # System sensors
+    'wifi_rssi',                     # wifiRssi (dBm)
+    'app_connected',                 # appOn (0/1)
+))
+
+_SWITCHES = tuple(sys.intern(name) for name in (
+    # Output port controls
+    'acOut_switch',                  # Control AC output on/off
+    'v12Out_switch',                 # Control 12V output on/off  
+    'usbOut_switch',                 # Control USB output on/off
+))
+
+_NUMBERS = tuple(sys.intern(name) for name in (
+    # Charge profile controls
+    'charge_profile_min_soc',        # Minimum charge level (0-100%)
+    'charge_profile_max_soc',        # Maximum charge level (0-100%)
+    'charge_profile_recharge_soc',   # Recharge start level (0-100%)
+    
+    # Display controls
+    'display_blackout_time',         # Screen timeout (seconds)
+    'display_brightness',            # Screen brightness (0-100%)
+))
+
+_BUTTONS = tuple(sys.intern(name) for name in (
+    # System controls
+    'reboot_device',                 # Reboot the device
+    'reset_device',                  # Factory reset
+    'check_for_updates',             # Check for firmware updates
+))
+
 def generate_complete_yeti500_entities() -> Dict[str, Any]:
     """Generate complete Yeti 500 entity definitions based on extracted data."""
     
@@ -148,81 +199,13 @@ def generate_complete_yeti500_entities() -> Dict[str, Any]:
             'battery_capacity_wh': device_data['battery_capacity_wh']
         },
         
-        'sensors': [
-            # Battery sensors (primary status data)
-            'battery_state_of_charge',       # batt.soc (%)
-            'battery_remaining_wh',          # batt.whRem (Wh)
-            'battery_voltage',               # batt.v (V)
-            'battery_cycles',                # batt.cyc (count)
-            'battery_temperature',           # batt.cTmp (°C)
-            'battery_time_to_empty_minutes', # batt.mTtef (minutes)
-            'battery_input_wh',              # batt.whIn (Wh total)
-            'battery_output_wh',             # batt.whOut (Wh total)
-            
-            # Battery advanced sensors
-            'battery_current_net',           # batt.aNet (A)
-            'battery_current_net_avg',       # batt.aNetAvg (A)
-            'battery_power_net',             # batt.wNet (W)
-            'battery_power_net_avg',         # batt.wNetAvg (W)
-            'battery_heater_relative_humidity', # batt.pctHtsRh (%)
-            'battery_heater_temperature',    # batt.cHtsTmp (°C)
-            
-            # AC Output port sensors
-            'acOut_status',                  # ports.acOut.s (0=off, 1=on)
-            'acOut_watts',                   # ports.acOut.w (W)
-            'acOut_voltage',                 # ports.acOut.v (V)
-            'acOut_amperage',                # ports.acOut.a (A)
-            
-            # AC Input port sensors
-            'acIn_status',                   # ports.acIn.s (0=off, 1=standby, 2=charging)
-            'acIn_watts',                    # ports.acIn.w (W)
-            'acIn_voltage',                  # ports.acIn.v (V scaled by 10)
-            'acIn_amperage',                 # ports.acIn.a (A)
-            'acIn_fast_charging',            # ports.acIn.fastChg (0/1)
-            
-            # 12V Output port sensors
-            'v12Out_status',                 # ports.v12Out.s (0=off, 1=on)
-            'v12Out_watts',                  # ports.v12Out.w (W)
-            
-            # USB Output port sensors
-            'usbOut_status',                 # ports.usbOut.s (0=off, 1=on)
-            'usbOut_watts',                  # ports.usbOut.w (W)
-            
-            # Low Voltage DC Input sensors
-            'lvDcIn_status',                 # ports.lvDcIn.s (0=off, 1=on)
-            'lvDcIn_watts',                  # ports.lvDcIn.w (W)
-            'lvDcIn_voltage',                # ports.lvDcIn.v (V)
-            'lvDcIn_amperage',               # ports.lvDcIn.a (A)
-            
-            # System sensors
-            'wifi_rssi',                     # wifiRssi (dBm)
-            'app_connected',                 # appOn (0/1)
-        ],
+        'sensors': _SENSORS,
         
-        'switches': [
-            # Output port controls
-            'acOut_switch',                  # Control AC output on/off
-            'v12Out_switch',                 # Control 12V output on/off  
-            'usbOut_switch',                 # Control USB output on/off
-        ],
+        'switches': _SWITCHES,
         
-        'numbers': [
-            # Charge profile controls
-            'charge_profile_min_soc',        # Minimum charge level (0-100%)
-            'charge_profile_max_soc',        # Maximum charge level (0-100%)
-            'charge_profile_recharge_soc',   # Recharge start level (0-100%)
-            
-            # Display controls
-            'display_blackout_time',         # Screen timeout (seconds)
-            'display_brightness',            # Screen brightness (0-100%)
-        ],
+        'numbers': _NUMBERS,
         
-        'buttons': [
-            # System controls
-            'reboot_device',                 # Reboot the device
-            'reset_device',                  # Factory reset
-            'check_for_updates',             # Check for firmware updates
-        ],
+        'buttons': _BUTTONS,
         
         'ble_protocol': {
             'handles': {
@@ -295,12 +278,23 @@ def main():
     print(f"  Numbers:     {len(entities['numbers'])} total")
     print(f"  Buttons:     {len(entities['buttons'])} total")
     
-    print(f"\n🔋 Battery Sensors ({len([s for s in entities['sensors'] if 'battery' in s])}):")
-    for sensor in [s for s in entities['sensors'] if 'battery' in s][:10]:
+    # Partition sensors in a single pass
+    by_group = {'battery': [], 'port': [], 'system': []}
+    port_prefixes = ('acOut', 'acIn', 'usbOut', 'v12Out', 'lvDcIn')
+    for s in entities['sensors']:
+        if 'battery' in s:
+            by_group['battery'].append(s)
+        elif s.startswith(port_prefixes):
+            by_group['port'].append(s)
+        else:
+            by_group['system'].append(s)
+    
+    print(f"\n🔋 Battery Sensors ({len(by_group['battery'])}):")
+    for sensor in by_group['battery'][:10]:
         print(f"    - {sensor}")
     
-    print(f"\n🔌 Port Sensors ({len([s for s in entities['sensors'] if any(p in s for p in ['acOut', 'acIn', 'usbOut', 'v12Out', 'lvDcIn'])])}):")
-    for sensor in [s for s in entities['sensors'] if any(p in s for p in ['acOut', 'acIn', 'usbOut', 'v12Out', 'lvDcIn'])][:12]:
+    print(f"\n🔌 Port Sensors ({len(by_group['port'])}):")
+    for sensor in by_group['port'][:12]:
         print(f"    - {sensor}")
     
     print(f"\n⚙️  Controls ({len(entities['switches']) + len(entities['numbers']) + len(entities['buttons'])}):")
@@ -312,9 +306,13 @@ def main():
     print(f"    Methods: {', '.join(entities['ble_protocol']['message_types'].keys())}")
     
     # Save complete specification
-    import json
-    with open('yeti500_implementation_spec.json', 'w') as f:
-        json.dump(entities, f, indent=2, default=str)
+    if orjson is not None:
+        with open('yeti500_implementation_spec.json', 'wb') as f:
+            f.write(orjson.dumps(entities, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+        with open('yeti500_implementation_spec.json', 'w') as f:
+            json.dump(entities, f, indent=2, default=str)
     
     print(f"\n💾 Complete implementation spec saved to: yeti500_implementation_spec.json")
     print(f"\n✅ Ready to implement Yeti 500 device class with {len(entities['sensors'])} sensors, {len(entities['switches'])} switches, {len(entities['numbers'])} numbers, and {len(entities['buttons'])} buttons!")
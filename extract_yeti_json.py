@@ -4,48 +4,144 @@ Better JSON extractor for Yeti 500 Wireshark data.
 """
 
 import csv
+from functools import lru_cache
+import io
 import json
+import mmap
 import re
 
-def clean_ascii_string(ascii_value):
+from yeti_capture import decode_ascii_hex as clean_ascii_string
+
+_IDENT_START = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+_IDENT_CHARS = _IDENT_START | frozenset("0123456789")
+_BAREWORD_CHARS = _IDENT_CHARS | frozenset(".-")
+
+@lru_cache(maxsize=256)
+def repair_json(json_str):
     """
-    Convert ASCII-converted colon-separated string back to readable text.
+    Quote bare keys and values in one pass so the text can go to json.loads.
+    
+    Applies the same fixes as the old chained regex substitutions:
+    identifiers after '{' or ',' are quoted, barewords after ':' are quoted,
+    quoted numbers after ':' are unquoted, and ':"[...]"' becomes ':[...]'.
     
     Args:
-        ascii_value: String like "H:e:l:l:o" or mixed ASCII/hex
+        json_str: Brace-delimited text recovered from the capture
         
     Returns:
-        Clean readable string
+        Repaired JSON text
     """
-    if not ascii_value:
-        return ""
+    out = []
+    append = out.append
+    n = len(json_str)
+    i = 0
+    array_end = -1  # index of the closing quote dropped from a ':"[...]"' value
+    
+    while i < n:
+        c = json_str[i]
+        
+        if i == array_end:
+            i += 1
+            continue
+        
+        if (c == '{' or c == ',') and i + 1 < n and json_str[i + 1] in _IDENT_START:
+            # Bare key: quote the identifier
+            j = i + 2
+            while j < n and json_str[j] in _IDENT_CHARS:
+                j += 1
+            append(c)
+            append('"')
+            append(json_str[i + 1:j])
+            append('"')
+            i = j
+            continue
+        
+        if c == ':' and i + 1 < n:
+            nxt = json_str[i + 1]
+            
+            if nxt in _IDENT_START:
+                # Bare value: quote it
+                j = i + 2
+                while j < n and json_str[j] in _BAREWORD_CHARS:
+                    j += 1
+                append(':"')
+                append(json_str[i + 1:j])
+                append('"')
+                i = j
+                continue
+            
+            if nxt == '"' and i + 2 < n:
+                # Quoted number: drop the quotes
+                j = i + 2
+                while j < n and json_str[j].isdecimal():
+                    j += 1
+                if j > i + 2:
+                    if j < n and json_str[j] == '.':
+                        j += 1
+                        while j < n and json_str[j].isdecimal():
+                            j += 1
+                    if j < n and json_str[j] == '"':
+                        append(':')
+                        append(json_str[i + 2:j])
+                        i = j + 1
+                        continue
+                
+                # Quoted array: drop the quotes around the brackets
+                elif json_str[i + 2] == '[' and i > array_end:
+                    close = json_str.find(']', i + 3)
+                    if close != -1 and json_str[close + 1:close + 2] == '"':
+                        append(':[')
+                        array_end = close + 1
+                        i += 3
+                        continue
+        
+        append(c)
+        i += 1
     
-    # Remove quotes that CSV might have added
-    ascii_value = ascii_value.strip('"')
+    return "".join(out)
+
+_BRACE_RE = re.compile(r'[{}]')
+
+def take_json_objects(text, eof=False):
+    """
+    Pull complete top-level JSON objects out of text with a brace depth counter.
     
-    # Split by colons
-    parts = ascii_value.split(':')
-    result = ""
+    Objects may nest to any depth. Quotes are not tracked: the capture
+    escapes them lossily (e.g. '"s""1}}}}}{"id"7'), and string state that
+    drifts out of sync would swallow the braces closing every later message.
+    At end of input an unterminated object is dropped and the text after its
+    opening brace is scanned again, so complete messages that follow a
+    truncated one are still found.
     
-    for part in parts:
-        if len(part) == 1:
-            # Single ASCII character
-            result += part
-        elif len(part) == 2:
-            # Could be hex byte
-            try:
-                byte_val = int(part, 16)
-                if 32 <= byte_val <= 126:  # Printable ASCII
-                    result += chr(byte_val)
-                else:
-                    result += f"[{part}]"  # Non-printable byte
-            except ValueError:
-                result += part
-        else:
-            # Multi-character, keep as-is
-            result += part
+    Args:
+        text: Buffered text for one handle
+        eof: True when no more text will follow
+        
+    Returns:
+        Tuple of (objects found, index where still-incomplete text starts)
+    """
+    objects = []
+    base = 0
     
-    return result
+    while True:
+        depth = 0
+        start = -1
+        for match in _BRACE_RE.finditer(text, base):
+            pos = match.start()
+            if text[pos] == '{':
+                if not depth:
+                    start = pos
+                depth += 1
+            elif depth:
+                depth -= 1
+                if not depth:
+                    objects.append(text[start:pos + 1])
+        
+        if not depth:
+            return objects, len(text)
+        if not eof:
+            return objects, start
+        base = start + 1
 
 def extract_complete_json_messages(csv_file):
     """
@@ -55,43 +151,69 @@ def extract_complete_json_messages(csv_file):
     print("=" * 80)
     
     try:
-        with open(csv_file, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
+        # Map the capture instead of copying it through buffered reads;
+        # large Wireshark exports are scanned once, front to back
+        with open(csv_file, 'rb') as infile, \
+                mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            reader = csv.reader(line.decode('utf-8') for line in iter(mm.readline, b''))
+            header = next(reader)
+            handle_idx = header.index('handle')
+            value_idx = header.index('value')
             
-            # Group messages by handle and try to reconstruct complete JSON
-            handle_data = {}
+            # Reassemble each handle's stream as rows arrive, keeping only the
+            # still-incomplete tail instead of every fragment
+            pending = {}
+            handle_objects = {}
+            other_data = {}
+            # Local names for the per-row hot path
+            pending_get = pending.get
+            clean = clean_ascii_string
+            take_objects = take_json_objects
             
             for row in reader:
-                handle = row['handle']
-                value = row['value']
+                if not row:
+                    continue  # DictReader skipped blank lines too
+                handle = row[handle_idx]
+                value = row[value_idx]
                 
-                if handle not in handle_data:
-                    handle_data[handle] = []
+                buf = pending_get(handle)
+                if buf is None:
+                    buf = pending[handle] = io.StringIO()
+                    handle_objects[handle] = []
+                    other_data[handle] = []
                 
                 # Convert to readable text
-                text = clean_ascii_string(value)
-                handle_data[handle].append(text)
+                text = clean(value)
+                buf.write(text)
+                if '}' in text:
+                    buffered = buf.getvalue()
+                    objects, rest = take_objects(buffered)
+                    if rest:
+                        handle_objects[handle].extend(objects)
+                        buf.seek(0)
+                        buf.truncate()
+                        buf.write(buffered[rest:])
+                
+                # Readable text for non-JSON data; only the first 200 chars are shown
+                if text and not text.startswith('{'):
+                    parts = other_data[handle]
+                    if sum(map(len, parts)) + len(parts) <= 200:
+                        parts.append(text)
             
             # Process each handle to find JSON messages
             json_count = 0
             
-            for handle, texts in handle_data.items():
+            for handle, json_strs in handle_objects.items():
                 print(f"\n🔍 Handle {handle}:")
                 
-                # Try to combine fragments into complete JSON
-                combined_text = "".join(texts)
+                # Flush whatever the end of the capture left open
+                json_strs.extend(take_json_objects(pending[handle].getvalue(), eof=True)[0])
                 
-                # Look for JSON patterns
-                json_matches = re.finditer(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', combined_text)
-                
-                for match in json_matches:
-                    json_str = match.group()
-                    
+                for json_str in json_strs:
                     # Clean up the JSON string
-                    json_str = re.sub(r'([{,])([a-zA-Z_][a-zA-Z0-9_]*)', r'\1"\2"', json_str)  # Add quotes to keys
-                    json_str = re.sub(r':([a-zA-Z_][a-zA-Z0-9_.-]*)', r':"\1"', json_str)  # Add quotes to string values
-                    json_str = re.sub(r':"(\d+\.?\d*)"', r':\1', json_str)  # Remove quotes from numbers
-                    json_str = re.sub(r':"\[([^\]]*)\]"', r':[\1]', json_str)  # Fix arrays
+                    json_str = repair_json(json_str)
                     
                     try:
                         # Try to parse as JSON
@@ -110,7 +232,7 @@ def extract_complete_json_messages(csv_file):
                             print(f"  📄 Text Fragment: {json_str[:200]}...")
                 
                 # Also show readable text for non-JSON data
-                readable_parts = [text for text in texts if text and not text.startswith('{')]
+                readable_parts = other_data[handle]
                 if readable_parts:
                     print(f"  📝 Other Data: {' '.join(readable_parts)[:200]}...")
                     
@@ -6,100 +6,172 @@ This extracts all commands, responses, and entity data.
 
 import csv
 import json
+import os
 import re
-from typing import Dict, List, Any, Tuple
-from collections import defaultdict
+from typing import Dict, Iterator, List, Any, Optional, Pattern, Tuple, cast
+from functools import partial
 
-def decode_ascii_hex(hex_string: str) -> str:
-    """Convert colon-separated ASCII hex values to readable text."""
-    if not hex_string:
-        return ""
-    
-    # Remove quotes if present
-    hex_string = hex_string.strip('"')
-    
-    # Split on colons and convert each hex value
-    parts = hex_string.split(':')
-    result = ""
-    
-    for part in parts:
-        if len(part) == 1:
-            # Single character
-            result += part
-        elif len(part) == 2:
-            try:
-                # Two-character hex value
-                byte_val = int(part, 16)
-                if 32 <= byte_val <= 126:  # Printable ASCII
-                    result += chr(byte_val)
-                else:
-                    result += f"[{part}]"
-            except ValueError:
-                result += part
-        else:
-            # Longer string, just add as-is
-            result += part
-    
-    return result
+from yeti_capture import BraceScanner, decode_ascii_hex, fix_malformed_json, map_in_batches, parse_cli_args
 
-def parse_csv_to_messages(csv_file: str) -> List[Dict[str, Any]]:
-    """Parse the CSV file and reconstruct complete JSON messages."""
-    print("📖 Parsing Wireshark CSV for complete message reconstruction...")
-    
-    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    messages = []
-    current_length = None
-    current_fragments = []
-    current_id = None
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+# Per-row progress output is off by default; set YETI_VERBOSE=1 to trace reassembly
+VERBOSE = os.environ.get('YETI_VERBOSE', '0') not in ('', '0')
+
+# Yeti 500 output ports, the ones that get a switch entity
+_OUTPUT_PORTS = frozenset(('acOut', 'v12Out', 'usbOut'))
+
+# Compiled once at import; these run for every reconstructed message
+_ID_RE = re.compile(r'"id"\s*:\s*(\d+)')
+_METHOD_RE = re.compile(r'"method"\s*:\s*"([^"]+)"')
+_SRC_RE = re.compile(r'"src"\s*:\s*"([^"]+)"')
+_ACTION_RE = re.compile(r'"action"\s*:\s*"([^"]+)"')
+_PORT_CONTROL_RE = re.compile(r'"ports"\s*:\s*\{[^}]*"(\w+)"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)')
+
+# Output name -> pattern for the regex fallback, scanned as one alternation
+_FIELD_PATTERNS: Dict[str, str] = {
+    'firmware': r'"fw"\s*:\s*"([^"]+)"',
+    'serial_number': r'"sn"\s*:\s*"([^"]+)"',
+    'battery_soc': r'"soc"\s*:\s*(\d+)',
+    'battery_voltage': r'"v"\s*:\s*([\d.]+)',
+    'battery_remaining': r'"whRem"\s*:\s*(\d+)',
+    'battery_input': r'"whIn"\s*:\s*(\d+)',
+    'battery_output': r'"whOut"\s*:\s*(\d+)',
+    'battery_cycles': r'"cyc"\s*:\s*(\d+)',
+    'battery_temp': r'"cTmp"\s*:\s*([\d.]+)',
+    'charge_profile_min': r'"min"\s*:\s*(\d+)',
+    'charge_profile_max': r'"max"\s*:\s*(\d+)',
+    'charge_profile_current': r'"rchg"\s*:\s*(\d+)',
+}
+# Zero-width lookaheads so matches may overlap, exactly as separate searches did
+_FIELD_SCAN_RE = re.compile('|'.join(f'(?=(?P<{key}>{pattern}))' for key, pattern in _FIELD_PATTERNS.items()))
+
+_PORT_PATTERNS: Dict[str, Pattern[str]] = {
+    port_name: re.compile(pattern) for port_name, pattern in {
+        'acOut': r'"acOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)',
+        'v12Out': r'"v12Out"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)',
+        'usbOut': r'"usbOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)',
+        'acIn': r'"acIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)',
+        'lvDcIn': r'"lvDcIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)',
+    }.items()
+}
+
+# Body key -> output name, used once a message parses as real JSON
+_FIELD_MAP = {
+    'fw': 'firmware',
+    'sn': 'serial_number',
+    'soc': 'battery_soc',
+    'v': 'battery_voltage',
+    'whRem': 'battery_remaining',
+    'whIn': 'battery_input',
+    'whOut': 'battery_output',
+    'cyc': 'battery_cycles',
+    'cTmp': 'battery_temp',
+    'min': 'charge_profile_min',
+    'max': 'charge_profile_max',
+    'rchg': 'charge_profile_current',
+}
+_PORT_FIELD_MAP = {'s': 'status', 'w': 'watts', 'v': 'voltage', 'a': 'amperage'}
+
+def load_fixed_json(json_str: str) -> Dict[str, Any] | None:
+    """Repair and parse a message, or return None if it still isn't valid JSON."""
+    try:
+        obj = json.loads(fix_malformed_json(json_str))
+    except json.JSONDecodeError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+def reassemble_messages(csv_file: str) -> Iterator[Tuple[int, int, str]]:
+    """Yield (row, decoded length, JSON text) for each message reassembled from the CSV."""
+    current_length: Optional[int] = None
+    current_fragments: List[str] = []
+    scanner = BraceScanner()
     
-    for i, row in enumerate(rows):
-        handle = row['handle']
-        value = row['value']
+    with open(csv_file, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        handle_idx = header.index('handle')
+        value_idx = header.index('value')
         
-        if handle == '0x0008':
-            # Length indicator - last byte is the message length
-            if value.startswith('00:00:00:'):
-                length_hex = value.split(':')[-1]
-                try:
-                    current_length = int(length_hex, 16)
-                    current_fragments = []
-                    print(f"Row {i+1}: New message, length={current_length}")
-                except ValueError:
-                    current_length = None
-                    
-        elif handle == '0x0003' and current_length is not None:
-            # JSON data fragment
-            decoded = decode_ascii_hex(value)
-            current_fragments.append(decoded)
+        # Rows are streamed; blank lines are skipped so numbering matches DictReader
+        for i, row in enumerate(filter(None, reader)):
+            handle = row[handle_idx]
+            value = row[value_idx]
             
-            # Check if we have a complete message
-            combined = ''.join(current_fragments)
-            if len(combined) >= current_length or combined.count('}') > 0:
-                # Try to extract complete JSON
-                json_match = re.search(r'\{.*\}', combined, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                    
-                    # Parse the JSON manually since it has non-standard format
-                    parsed = parse_yeti_json_message(json_str)
-                    if parsed:
-                        messages.append({
-                            'row': i + 1,
-                            'raw_json': json_str,
-                            'decoded_length': current_length,
-                            'actual_length': len(json_str),
-                            'parsed': parsed
-                        })
-                        print(f"  ✅ Extracted: {parsed.get('method', 'unknown')} (ID: {parsed.get('id', '?')})")
+            if handle == '0x0008':
+                # Length indicator - last byte is the message length
+                if value.startswith('00:00:00:'):
+                    length_hex = value.split(':')[-1]
+                    try:
+                        current_length = int(length_hex, 16)
+                        current_fragments = []
+                        scanner = BraceScanner()
+                        if VERBOSE:
+                            print(f"Row {i+1}: New message, length={current_length}")
+                    except ValueError:
+                        current_length = None
+                        
+            elif handle == '0x0003' and current_length is not None:
+                # JSON data fragment
+                decoded = decode_ascii_hex(value)
+                current_fragments.append(decoded)
                 
-                # Reset for next message
-                current_length = None
-                current_fragments = []
+                # Check if we have a complete message, scanning only the new text
+                closed = scanner.feed(decoded)
+                if scanner.offset >= current_length or '}' in decoded:
+                    combined = ''.join(current_fragments)
+                    if closed:
+                        start, end = scanner.start, scanner.end
+                    else:
+                        # Truncated object: keep the first '{' to last '}' span
+                        start, end = combined.find('{'), combined.rfind('}')
+                    if start != -1 and end > start:
+                        json_str = combined[start:end + 1]
+                        yield i + 1, current_length, json_str
+                    
+                    # Reset for next message
+                    current_length = None
+                    current_fragments = []
+                    scanner = BraceScanner()
+
+def _parse_one(item: Tuple[int, int, str], keep_raw: bool = False) -> Dict[str, Any] | None:
+    """Parse one reassembled message; runs in a worker process when parsing in parallel."""
+    row, decoded_length, json_str = item
     
-    return messages
+    # Parse the JSON manually since it has non-standard format
+    parsed = parse_yeti_json_message(json_str)
+    if not parsed:
+        return None
+    message: Dict[str, Any] = {'row': row}
+    if keep_raw:
+        message['raw_json'] = json_str
+    message['decoded_length'] = decoded_length
+    message['actual_length'] = len(json_str)
+    message['parsed'] = parsed
+    return message
+
+def parse_csv_to_messages(
+    csv_file: str, keep_raw: bool = False, workers: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """Parse the CSV file and yield complete JSON messages in capture order.
+    
+    The reassembled JSON text is only included when keep_raw is set.
+    With workers > 1 the reassembled messages are parsed in a process pool,
+    a bounded batch at a time.
+    """
+    print("📖 Parsing Wireshark CSV for complete message reconstruction...")
+    
+    parse_one = partial(_parse_one, keep_raw=keep_raw)
+    for message in map_in_batches(parse_one, reassemble_messages(csv_file), workers):
+        if message is None:
+            continue
+        if VERBOSE:
+            parsed = message['parsed']
+            print(f"  ✅ Extracted: {parsed.get('method', 'unknown')} (ID: {parsed.get('id', '?')})")
+        yield message
 
 def parse_yeti_json_message(json_str: str) -> Dict[str, Any] | None:
     """Parse a Yeti JSON message into structured data."""
@@ -114,18 +186,18 @@ def parse_yeti_json_message(json_str: str) -> Dict[str, Any] | None:
             pass
         
         # Manual parsing for the specific Yeti format
-        message = {}
+        message: Dict[str, Any] = {}
         
         # Extract basic fields
-        id_match = re.search(r'"id"\s*:\s*(\d+)', json_str)
+        id_match = _ID_RE.search(json_str)
         if id_match:
             message['id'] = int(id_match.group(1))
         
-        method_match = re.search(r'"method"\s*:\s*"([^"]+)"', json_str)
+        method_match = _METHOD_RE.search(json_str)
         if method_match:
             message['method'] = method_match.group(1)
         
-        src_match = re.search(r'"src"\s*:\s*"([^"]+)"', json_str)
+        src_match = _SRC_RE.search(json_str)
         if src_match:
             message['src'] = src_match.group(1)
         
@@ -145,31 +217,45 @@ def parse_yeti_json_message(json_str: str) -> Dict[str, Any] | None:
         print(f"Error parsing JSON: {e}")
         return None
 
+def _collect_fields(node: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Copy mapped scalar fields out of a body, first occurrence wins."""
+    for key, value in node.items():
+        if isinstance(value, dict):
+            if key != 'ports':
+                _collect_fields(value, result)
+        elif key in _FIELD_MAP and _FIELD_MAP[key] not in result:
+            result[_FIELD_MAP[key]] = value
+
 def extract_result_body(json_str: str) -> Dict[str, Any]:
     """Extract the result body from a response."""
-    result = {}
+    result: Dict[str, Any] = {}
     
-    # Extract common fields from body
-    patterns = {
-        'firmware': r'"fw"\s*:\s*"([^"]+)"',
-        'serial_number': r'"sn"\s*:\s*"([^"]+)"',
-        'battery_soc': r'"soc"\s*:\s*(\d+)',
-        'battery_voltage': r'"v"\s*:\s*([\d.]+)',
-        'battery_remaining': r'"whRem"\s*:\s*(\d+)',
-        'battery_input': r'"whIn"\s*:\s*(\d+)',
-        'battery_output': r'"whOut"\s*:\s*(\d+)',
-        'battery_cycles': r'"cyc"\s*:\s*(\d+)',
-        'battery_temp': r'"cTmp"\s*:\s*([\d.]+)',
-        'charge_profile_min': r'"min"\s*:\s*(\d+)',
-        'charge_profile_max': r'"max"\s*:\s*(\d+)',
-        'charge_profile_current': r'"rchg"\s*:\s*(\d+)',
-    }
+    # One JSON parse and plain lookups when the repaired message is complete
+    obj = load_fixed_json(json_str)
+    if obj is not None:
+        body = (obj.get('result') or {}).get('body') or {}
+        _collect_fields(body, result)
+        ports = {
+            port_name: {_PORT_FIELD_MAP[k]: v for k, v in port_data.items() if k in _PORT_FIELD_MAP}
+            for port_name, port_data in (body.get('ports') or {}).items()
+            if isinstance(port_data, dict)
+        }
+        if ports:
+            result['ports'] = ports
+        return result
     
-    for key, pattern in patterns.items():
-        match = re.search(pattern, json_str)
-        if match:
+    # Truncated or otherwise unparseable: scrape fields with one regex pass,
+    # keeping the first occurrence of each
+    found: Dict[str, str] = {}
+    for field_match in _FIELD_SCAN_RE.finditer(json_str):
+        key = cast(str, field_match.lastgroup)
+        if key not in found:
+            found[key] = field_match.group(cast(int, field_match.lastindex) + 1)
+    
+    for key in _FIELD_PATTERNS:
+        if key in found:
+            value = found[key]
             try:
-                value = match.group(1)
                 if '.' in value:
                     result[key] = float(value)
                 else:
@@ -179,16 +265,8 @@ def extract_result_body(json_str: str) -> Dict[str, Any]:
     
     # Extract port status
     ports = {}
-    port_patterns = {
-        'acOut': r'"acOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)',
-        'v12Out': r'"v12Out"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)',
-        'usbOut': r'"usbOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)',
-        'acIn': r'"acIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)',
-        'lvDcIn': r'"lvDcIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)',
-    }
-    
-    for port_name, pattern in port_patterns.items():
-        match = re.search(pattern, json_str)
+    for port_name, pattern in _PORT_PATTERNS.items():
+        match = pattern.search(json_str)
         if match:
             port_data: Dict[str, Any] = {'status': int(match.group(1))}
             if len(match.groups()) >= 2:
@@ -208,30 +286,48 @@ def extract_result_body(json_str: str) -> Dict[str, Any]:
 
 def extract_params(json_str: str) -> Dict[str, Any]:
     """Extract parameters from a request."""
-    params = {}
+    params: Dict[str, Any] = {}
+    
+    obj = load_fixed_json(json_str)
+    if obj is not None:
+        request_params = obj.get('params') or {}
+        if 'action' in request_params:
+            params['action'] = request_params['action']
+        ports = (request_params.get('body') or {}).get('ports') or {}
+        for port_name, port_data in ports.items():
+            if isinstance(port_data, dict) and 's' in port_data:
+                params['port'] = port_name
+                params['state'] = port_data['s']
+            break
+        return params
     
     # Extract action and body for control commands
-    action_match = re.search(r'"action"\s*:\s*"([^"]+)"', json_str)
+    action_match = _ACTION_RE.search(json_str)
     if action_match:
         params['action'] = action_match.group(1)
     
     # Extract port control commands
     if 'ports' in json_str:
-        port_match = re.search(r'"ports"\s*:\s*\{[^}]*"(\w+)"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)', json_str)
+        port_match = _PORT_CONTROL_RE.search(json_str)
         if port_match:
             params['port'] = port_match.group(1)
             params['state'] = int(port_match.group(2))
     
     return params
 
-def analyze_protocol_comprehensive(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Comprehensive analysis of the protocol."""
-    analysis = {
-        'total_messages': len(messages),
-        'methods': defaultdict(lambda: {'requests': 0, 'responses': 0, 'examples': []}),
+# Result keys that become entities in the analysis
+_BATTERY_KEYS = ('battery_soc', 'battery_voltage', 'battery_remaining', 'battery_input',
+                 'battery_output', 'battery_cycles', 'battery_temp')
+_CHARGE_PROFILE_KEYS = ('charge_profile_min', 'charge_profile_max', 'charge_profile_current')
+
+def new_analysis() -> Dict[str, Any]:
+    """Return an empty analysis for update_analysis to fill in."""
+    return {
+        'total_messages': 0,
+        'methods': {},
         'entities': {
-            'sensors': [],
-            'controls': [],
+            'sensors': set(),
+            'controls': set(),
             'device_info': {}
         },
         'ble_handles': {
@@ -240,66 +336,80 @@ def analyze_protocol_comprehensive(messages: List[Dict[str, Any]]) -> Dict[str,
             '0x0005': 'Response status/acknowledgment'
         }
     }
+
+def update_analysis(analysis: Dict[str, Any], msg: Dict[str, Any]) -> None:
+    """Fold one parsed message into a running analysis."""
+    analysis['total_messages'] += 1
+    entities = analysis['entities']
+    device_info = entities['device_info']
+    sensors_add = entities['sensors'].add
+    controls_add = entities['controls'].add
     
-    print(f"\n📊 Comprehensive Protocol Analysis")
-    print("=" * 60)
+    parsed = msg['parsed']
+    method = parsed.get('method', 'unknown')
+    msg_type = parsed.get('type', 'unknown')
     
-    # Analyze by method
-    for msg in messages:
-        parsed = msg['parsed']
-        method = parsed.get('method', 'unknown')
-        msg_type = parsed.get('type', 'unknown')
-        
-        analysis['methods'][method][f'{msg_type}s'] += 1
-        if len(analysis['methods'][method]['examples']) < 3:
-            analysis['methods'][method]['examples'].append(parsed)
+    method_stats = analysis['methods']
+    stats = method_stats.get(method)
+    if stats is None:
+        stats = method_stats[method] = {'requests': 0, 'responses': 0, 'examples': []}
+    if msg_type == 'response':
+        stats['responses'] += 1
+    elif msg_type == 'request':
+        stats['requests'] += 1
+    if len(stats['examples']) < 3:
+        stats['examples'].append(parsed)
+    
+    if msg_type != 'response':
+        return
+    result = parsed.get('result', {})
     
     # Extract all unique sensor entities from status responses
-    status_sensors = set()
-    control_entities = set()
-    device_info = {}
+    if method == 'status':
+        # Battery sensors
+        for key in _BATTERY_KEYS:
+            if key in result:
+                sensors_add(key)
+        
+        # Port sensors and controls
+        for port_name, port_data in result.get('ports', {}).items():
+            sensors_add(f"{port_name}_status")
+            sensors_add(f"{port_name}_watts")
+            if 'voltage' in port_data:
+                sensors_add(f"{port_name}_voltage")
+            if 'amperage' in port_data:
+                sensors_add(f"{port_name}_amperage")
+            
+            # Add as controllable if it's an output port
+            if port_name in _OUTPUT_PORTS:
+                controls_add(f"{port_name}_switch")
+    
+    elif method == 'device':
+        if 'firmware' in result:
+            device_info['firmware'] = result['firmware']
+        if 'serial_number' in result:
+            device_info['serial_number'] = result['serial_number']
     
+    elif method == 'config':
+        for key in _CHARGE_PROFILE_KEYS:
+            if key in result:
+                controls_add(key)
+
+def analyze_protocol_comprehensive(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Comprehensive analysis of the protocol."""
+    analysis = new_analysis()
     for msg in messages:
-        parsed = msg['parsed']
-        if parsed.get('method') == 'status' and parsed.get('type') == 'response':
-            result = parsed.get('result', {})
-            
-            # Battery sensors
-            for key in ['battery_soc', 'battery_voltage', 'battery_remaining', 'battery_input', 
-                       'battery_output', 'battery_cycles', 'battery_temp']:
-                if key in result:
-                    status_sensors.add(key)
-            
-            # Port sensors and controls
-            ports = result.get('ports', {})
-            for port_name, port_data in ports.items():
-                status_sensors.add(f"{port_name}_status")
-                status_sensors.add(f"{port_name}_watts")
-                if 'voltage' in port_data:
-                    status_sensors.add(f"{port_name}_voltage")
-                if 'amperage' in port_data:
-                    status_sensors.add(f"{port_name}_amperage")
-                
-                # Add as controllable if it's an output port
-                if 'Out' in port_name:
-                    control_entities.add(f"{port_name}_switch")
-        
-        elif parsed.get('method') == 'device' and parsed.get('type') == 'response':
-            result = parsed.get('result', {})
-            if 'firmware' in result:
-                device_info['firmware'] = result['firmware']
-            if 'serial_number' in result:
-                device_info['serial_number'] = result['serial_number']
-        
-        elif parsed.get('method') == 'config' and parsed.get('type') == 'response':
-            result = parsed.get('result', {})
-            for key in ['charge_profile_min', 'charge_profile_max', 'charge_profile_current']:
-                if key in result:
-                    control_entities.add(key)
+        update_analysis(analysis, msg)
+    return finish_analysis(analysis)
+
+def finish_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Sort the collected entities and print the analysis summary."""
+    print(f"\n📊 Comprehensive Protocol Analysis")
+    print("=" * 60)
     
-    analysis['entities']['sensors'] = sorted(list(status_sensors))
-    analysis['entities']['controls'] = sorted(list(control_entities))
-    analysis['entities']['device_info'] = device_info
+    entities = analysis['entities']
+    entities['sensors'] = sorted(entities['sensors'])
+    entities['controls'] = sorted(entities['controls'])
     
     # Print analysis
     print(f"📋 Methods Found:")
@@ -312,18 +422,23 @@ def analyze_protocol_comprehensive(messages: List[Dict[str, Any]]) -> Dict[str,
     
     return analysis
 
-def main():
+def main() -> None:
     """Main analysis function."""
     csv_file = "testing/Wireshark_filtered_decode.csv"
+    args = parse_cli_args(__doc__)
     
-    # Parse all messages
-    messages = parse_csv_to_messages(csv_file)
+    # Parse messages, analysing each one as it is reassembled
+    messages: List[Dict[str, Any]] = []
+    analysis = new_analysis()
+    for msg in parse_csv_to_messages(csv_file, keep_raw=args.keep_raw, workers=args.workers):
+        messages.append(msg)
+        update_analysis(analysis, msg)
     
     if messages:
         print(f"\n✅ Successfully parsed {len(messages)} complete JSON messages")
         
         # Comprehensive analysis
-        analysis = analyze_protocol_comprehensive(messages)
+        finish_analysis(analysis)
         
         # Save complete results
         output = {
@@ -331,8 +446,12 @@ def main():
             'analysis': analysis
         }
         
-        with open('yeti500_complete_protocol.json', 'w') as f:
-            json.dump(output, f, indent=2, default=str)
+        if orjson is not None:
+            with open('yeti500_complete_protocol.json', 'wb') as f:
+                f.write(orjson.dumps(output, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open('yeti500_complete_protocol.json', 'w') as f:
+                json.dump(output, f, indent=2, default=str)
         
         print(f"\n💾 Complete protocol analysis saved to: yeti500_complete_protocol.json")
         
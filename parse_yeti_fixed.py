@@ -5,111 +5,118 @@ Fixed Yeti 500 JSON protocol parser that handles the malformed JSON format corre
 
 import csv
 import json
-import re
-from typing import Dict, List, Any, Tuple
-from collections import defaultdict
+import os
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from functools import partial
 
-def decode_ascii_hex(hex_string: str) -> str:
-    """Convert colon-separated ASCII hex values to readable text."""
-    if not hex_string:
-        return ""
-    
-    hex_string = hex_string.strip('"')
-    parts = hex_string.split(':')
-    result = ""
-    
-    for part in parts:
-        if len(part) == 1:
-            result += part
-        elif len(part) == 2:
-            try:
-                byte_val = int(part, 16)
-                if 32 <= byte_val <= 126:
-                    result += chr(byte_val)
-                else:
-                    result += f"[{part}]"
-            except ValueError:
-                result += part
-        else:
-            result += part
-    
-    return result
+from yeti_capture import BraceScanner, decode_ascii_hex, fix_malformed_json, map_in_batches, parse_cli_args
 
-def fix_malformed_json(json_str: str) -> str:
-    """Fix the malformed JSON format used by Yeti devices."""
-    # The format has missing colons after field names
-    # Convert: "field"value to "field":value
-    fixed = re.sub(r'"([^"]+)"(\d+|"[^"]*"|\{|\[)', r'"\1":\2', json_str)
-    
-    # Fix some specific patterns
-    fixed = re.sub(r'"method""([^"]+)"', r'"method":"\1"', fixed)
-    fixed = re.sub(r'"src""([^"]+)"', r'"src":"\1"', fixed)
-    fixed = re.sub(r'"action""([^"]+)"', r'"action":"\1"', fixed)
-    
-    return fixed
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
 
-def parse_csv_to_messages(csv_file: str) -> List[Dict[str, Any]]:
-    """Parse the CSV file and reconstruct complete JSON messages."""
-    print("📖 Parsing Wireshark CSV for complete message reconstruction...")
-    
-    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    messages = []
-    current_length = None
-    current_fragments = []
+# Per-row progress output is off by default; set YETI_VERBOSE=1 to trace reassembly
+VERBOSE = os.environ.get('YETI_VERBOSE', '0') not in ('', '0')
+
+# Yeti 500 port names; output ports are the switchable ones
+_OUTPUT_PORTS = frozenset(('acOut', 'v12Out', 'usbOut'))
+_INPUT_PORTS = frozenset(('acIn', 'lvDcIn'))
+_PORT_NAMES = tuple(_OUTPUT_PORTS | _INPUT_PORTS)
+
+def reassemble_messages(csv_file: str) -> Iterator[Tuple[int, int, str]]:
+    """Yield (row, decoded length, JSON text) for each message reassembled from the CSV."""
+    current_length: Optional[int] = None
+    current_fragments: List[str] = []
+    scanner = BraceScanner()
     
-    for i, row in enumerate(rows):
-        handle = row['handle']
-        value = row['value']
+    with open(csv_file, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        handle_idx = header.index('handle')
+        value_idx = header.index('value')
         
-        if handle == '0x0008':
-            # Length indicator
-            if value.startswith('00:00:00:'):
-                length_hex = value.split(':')[-1]
-                try:
-                    current_length = int(length_hex, 16)
-                    current_fragments = []
-                    print(f"Row {i+1}: New message, length={current_length}")
-                except ValueError:
-                    current_length = None
-                    
-        elif handle == '0x0003' and current_length is not None:
-            # JSON data fragment
-            decoded = decode_ascii_hex(value)
-            current_fragments.append(decoded)
+        # Rows are streamed; blank lines are skipped so numbering matches DictReader
+        for i, row in enumerate(filter(None, reader)):
+            handle = row[handle_idx]
+            value = row[value_idx]
             
-            # Check if we have a complete message
-            combined = ''.join(current_fragments)
-            if combined.count('}') > 0:
-                # Extract the JSON
-                json_match = re.search(r'\{.*?\}', combined, re.DOTALL)
-                if json_match:
-                    raw_json = json_match.group(0)
-                    
-                    # Fix and parse the JSON
-                    fixed_json = fix_malformed_json(raw_json)
-                    parsed = parse_yeti_json(fixed_json, raw_json)
-                    
-                    if parsed:
-                        messages.append({
-                            'row': i + 1,
-                            'raw_json': raw_json,
-                            'fixed_json': fixed_json,
-                            'decoded_length': current_length,
-                            'actual_length': len(raw_json),
-                            'parsed': parsed
-                        })
-                        method = parsed.get('method', 'unknown')
-                        msg_type = parsed.get('type', 'request')
-                        print(f"  ✅ Extracted: {method} {msg_type} (ID: {parsed.get('id', '?')})")
+            if handle == '0x0008':
+                # Length indicator
+                if value.startswith('00:00:00:'):
+                    length_hex = value.split(':')[-1]
+                    try:
+                        current_length = int(length_hex, 16)
+                        current_fragments = []
+                        scanner = BraceScanner()
+                        if VERBOSE:
+                            print(f"Row {i+1}: New message, length={current_length}")
+                    except ValueError:
+                        current_length = None
+                        
+            elif handle == '0x0003' and current_length is not None:
+                # JSON data fragment
+                decoded = decode_ascii_hex(value)
+                current_fragments.append(decoded)
                 
-                # Reset for next message
-                current_length = None
-                current_fragments = []
+                # Check if we have a complete message, scanning only the new text
+                closed = scanner.feed(decoded)
+                if '}' in decoded:
+                    combined = ''.join(current_fragments)
+                    if closed:
+                        start, end = scanner.start, scanner.end
+                    else:
+                        # Truncated object: keep the first '{' to next '}' span
+                        start = combined.find('{')
+                        end = combined.find('}', start)
+                    if start != -1 and end > start:
+                        raw_json = combined[start:end + 1]
+                        yield i + 1, current_length, raw_json
+                    
+                    # Reset for next message
+                    current_length = None
+                    current_fragments = []
+                    scanner = BraceScanner()
+
+def _parse_one(item: Tuple[int, int, str], keep_raw: bool = False) -> Dict[str, Any] | None:
+    """Fix and parse one reassembled message; runs in a worker process when parsing in parallel."""
+    row, decoded_length, raw_json = item
+    
+    # Fix and parse the JSON
+    fixed_json = fix_malformed_json(raw_json)
+    parsed = parse_yeti_json(fixed_json, raw_json)
+    if not parsed:
+        return None
+    message: Dict[str, Any] = {'row': row}
+    if keep_raw:
+        message['raw_json'] = raw_json
+        message['fixed_json'] = fixed_json
+    message['decoded_length'] = decoded_length
+    message['actual_length'] = len(raw_json)
+    message['parsed'] = parsed
+    return message
+
+def parse_csv_to_messages(
+    csv_file: str, keep_raw: bool = False, workers: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """Parse the CSV file and yield complete JSON messages in capture order.
+    
+    The raw and repaired JSON text is only included when keep_raw is set.
+    With workers > 1 the reassembled messages are parsed in a process pool,
+    a bounded batch at a time.
+    """
+    print("📖 Parsing Wireshark CSV for complete message reconstruction...")
     
-    return messages
+    parse_one = partial(_parse_one, keep_raw=keep_raw)
+    for message in map_in_batches(parse_one, reassemble_messages(csv_file), workers):
+        if message is None:
+            continue
+        if VERBOSE:
+            parsed = message['parsed']
+            method = parsed.get('method', 'unknown')
+            msg_type = parsed.get('type', 'request')
+            print(f"  ✅ Extracted: {method} {msg_type} (ID: {parsed.get('id', '?')})")
+        yield message
 
 def parse_yeti_json(json_str: str, original: str) -> Dict[str, Any] | None:
     """Parse a fixed Yeti JSON message."""
@@ -133,101 +140,115 @@ def parse_yeti_json(json_str: str, original: str) -> Dict[str, Any] | None:
         print(f"     Fixed:    {json_str[:50]}...")
         return None
 
-def extract_all_entities(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Extract all entities from the parsed messages."""
-    entities = {
+# Battery body key -> sensor name
+_BATTERY_SENSORS = {
+    'soc': 'battery_soc',
+    'whRem': 'battery_remaining_wh',
+    'v': 'battery_voltage',
+    'cyc': 'battery_cycles',
+    'cTmp': 'battery_temperature',
+    'whIn': 'battery_input_wh',
+    'whOut': 'battery_output_wh'
+}
+
+def new_entities() -> Dict[str, Any]:
+    """Return empty entity collections for update_entities to fill in."""
+    return {
         'sensors': set(),
         'controls': set(),
         'device_info': {},
-        'methods': defaultdict(list)
+        'methods': {}  # method -> [message count, first few messages]
     }
+
+def update_entities(entities: Dict[str, Any], msg: Dict[str, Any]) -> None:
+    """Fold the entities revealed by one parsed message into the collections."""
+    device_info = entities['device_info']
+    sensors_add = entities['sensors'].add
+    controls_add = entities['controls'].add
     
-    for msg in messages:
-        parsed = msg['parsed']
-        method = parsed.get('method', 'unknown')
-        entities['methods'][method].append(parsed)
+    parsed = msg['parsed']
+    method = parsed.get('method', 'unknown')
+    msg_type = parsed.get('type')
+    stats = entities['methods'].get(method)
+    if stats is None:
+        entities['methods'][method] = [1, [parsed]]
+    else:
+        stats[0] += 1
+        if len(stats[1]) < 3:
+            stats[1].append(parsed)
+    
+    if method == 'device' and msg_type == 'response':
+        body = parsed.get('result', {}).get('body', {})
         
-        if method == 'device' and parsed.get('type') == 'response':
-            result = parsed.get('result', {})
-            body = result.get('body', {})
-            
-            # Extract device info
-            if 'fw' in body:
-                entities['device_info']['firmware'] = body['fw']
-            if 'sn' in body:
-                entities['device_info']['serial_number'] = body['sn']
-            if 'identity' in body:
-                identity = body['identity']
-                if 'thingName' in identity:
-                    entities['device_info']['thing_name'] = identity['thingName']
-                if 'local' in identity:
-                    entities['device_info']['local_name'] = identity['local']
+        # Extract device info
+        if 'fw' in body:
+            device_info['firmware'] = body['fw']
+        if 'sn' in body:
+            device_info['serial_number'] = body['sn']
+        if 'identity' in body:
+            identity = body['identity']
+            if 'thingName' in identity:
+                device_info['thing_name'] = identity['thingName']
+            if 'local' in identity:
+                device_info['local_name'] = identity['local']
+    
+    elif method == 'status' and msg_type == 'response':
+        body = parsed.get('result', {}).get('body', {})
         
-        elif method == 'status' and parsed.get('type') == 'response':
-            result = parsed.get('result', {})
-            body = result.get('body', {})
-            
-            # Battery entities
-            if 'batt' in body:
-                batt = body['batt']
-                for key in ['soc', 'whRem', 'v', 'cyc', 'cTmp', 'whIn', 'whOut']:
-                    if key in batt:
-                        sensor_name = {
-                            'soc': 'battery_soc',
-                            'whRem': 'battery_remaining_wh',
-                            'v': 'battery_voltage',
-                            'cyc': 'battery_cycles',
-                            'cTmp': 'battery_temperature',
-                            'whIn': 'battery_input_wh',
-                            'whOut': 'battery_output_wh'
-                        }.get(key, f'battery_{key}')
-                        entities['sensors'].add(sensor_name)
-            
-            # Port entities
-            if 'ports' in body:
-                ports = body['ports']
-                for port_name, port_data in ports.items():
-                    # Status sensor
-                    entities['sensors'].add(f"{port_name}_status")
-                    
-                    # Power/voltage sensors
-                    if 'w' in port_data:
-                        entities['sensors'].add(f"{port_name}_watts")
-                    if 'v' in port_data:
-                        entities['sensors'].add(f"{port_name}_voltage")
-                    if 'a' in port_data:
-                        entities['sensors'].add(f"{port_name}_amperage")
-                    
-                    # Control switches for output ports
-                    if 'Out' in port_name:
-                        entities['controls'].add(f"{port_name}_switch")
+        # Battery entities
+        if 'batt' in body:
+            batt = body['batt']
+            for key, sensor_name in _BATTERY_SENSORS.items():
+                if key in batt:
+                    sensors_add(sensor_name)
         
-        elif method == 'config' and parsed.get('type') == 'response':
-            result = parsed.get('result', {})
-            body = result.get('body', {})
-            
-            # Charge profile controls
-            if 'chgPrfl' in body:
-                chg_profile = body['chgPrfl']
-                if 'min' in chg_profile:
-                    entities['controls'].add('charge_profile_min')
-                if 'max' in chg_profile:
-                    entities['controls'].add('charge_profile_max')
-                if 'rchg' in chg_profile:
-                    entities['controls'].add('charge_profile_current')
+        # Port entities
+        if 'ports' in body:
+            for port_name, port_data in body['ports'].items():
+                # Status sensor
+                sensors_add(f"{port_name}_status")
+                
+                # Power/voltage sensors
+                if 'w' in port_data:
+                    sensors_add(f"{port_name}_watts")
+                if 'v' in port_data:
+                    sensors_add(f"{port_name}_voltage")
+                if 'a' in port_data:
+                    sensors_add(f"{port_name}_amperage")
+                
+                # Control switches for output ports
+                if port_name in _OUTPUT_PORTS:
+                    controls_add(f"{port_name}_switch")
+    
+    elif method == 'config' and msg_type == 'response':
+        body = parsed.get('result', {}).get('body', {})
         
-        elif parsed.get('type') == 'request' and 'params' in parsed:
-            params = parsed['params']
-            
-            # Control requests reveal controllable entities
-            if 'action' in params and params['action'] == 'PATCH':
-                if 'body' in params and 'ports' in params['body']:
-                    # Port control
-                    ports = params['body']['ports']
-                    for port_name in ports.keys():
-                        if 'Out' in port_name:
-                            entities['controls'].add(f"{port_name}_switch")
+        # Charge profile controls
+        if 'chgPrfl' in body:
+            chg_profile = body['chgPrfl']
+            if 'min' in chg_profile:
+                controls_add('charge_profile_min')
+            if 'max' in chg_profile:
+                controls_add('charge_profile_max')
+            if 'rchg' in chg_profile:
+                controls_add('charge_profile_current')
     
+    elif msg_type == 'request' and 'params' in parsed:
+        params = parsed['params']
+        
+        # Control requests reveal controllable entities
+        if params.get('action') == 'PATCH':
+            if 'body' in params and 'ports' in params['body']:
+                # Port control
+                for port_name in params['body']['ports']:
+                    if port_name in _OUTPUT_PORTS:
+                        controls_add(f"{port_name}_switch")
+
+def extract_all_entities(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extract all entities from the parsed messages."""
+    entities = new_entities()
+    for msg in messages:
+        update_entities(entities, msg)
     return entities
 
 def generate_entity_definitions(entities: Dict[str, Any]) -> str:
@@ -249,30 +270,36 @@ def generate_entity_definitions(entities: Dict[str, Any]) -> str:
 {chr(10).join(f"- {control}" for control in controls)}
 
 ## Methods Available
-{chr(10).join(f"- {method}: {len(msgs)} messages" for method, msgs in entities['methods'].items())}
+{chr(10).join(f"- {method}: {count} messages" for method, (count, _) in entities['methods'].items())}
 """
     return definition
 
-def main():
+def main() -> None:
     """Main analysis function."""
     csv_file = "testing/Wireshark_filtered_decode.csv"
+    args = parse_cli_args(__doc__)
     
-    # Parse all messages
-    messages = parse_csv_to_messages(csv_file)
+    # Parse messages, extracting entities from each one as it is reassembled
+    messages: List[Dict[str, Any]] = []
+    entities = new_entities()
+    for msg in parse_csv_to_messages(csv_file, keep_raw=args.keep_raw, workers=args.workers):
+        messages.append(msg)
+        update_entities(entities, msg)
     
     if messages:
         print(f"\n✅ Successfully parsed {len(messages)} complete JSON messages")
         
-        # Extract entities
-        entities = extract_all_entities(messages)
+        # Sort each entity set once; the summary and the output share the lists
+        sensors = sorted(entities['sensors'])
+        controls = sorted(entities['controls'])
         
         # Generate comprehensive analysis
-        analysis = {
+        analysis: Dict[str, Any] = {
             'total_messages': len(messages),
-            'methods': {method: len(msgs) for method, msgs in entities['methods'].items()},
+            'methods': {method: count for method, (count, _) in entities['methods'].items()},
             'entities_found': {
-                'sensors': sorted(entities['sensors']),
-                'controls': sorted(entities['controls']),
+                'sensors': sensors,
+                'controls': controls,
                 'device_info': entities['device_info']
             }
         }
@@ -282,14 +309,18 @@ def main():
             'messages': messages,
             'analysis': analysis,
             'entities': {
-                'sensors': sorted(entities['sensors']),
-                'controls': sorted(entities['controls']),
+                'sensors': sensors,
+                'controls': controls,
                 'device_info': entities['device_info']
             }
         }
         
-        with open('yeti500_entities_complete.json', 'w') as f:
-            json.dump(output, f, indent=2, default=str)
+        if orjson is not None:
+            with open('yeti500_entities_complete.json', 'wb') as f:
+                f.write(orjson.dumps(output, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open('yeti500_entities_complete.json', 'w') as f:
+                json.dump(output, f, indent=2, default=str)
         
         # Generate entity definitions
         definitions = generate_entity_definitions(entities)
@@ -309,7 +340,7 @@ def main():
         # Show key entities
         print(f"\n📋 Key Entities Found:")
         print(f"  Battery: {[s for s in entities['sensors'] if 'battery' in s][:5]}")
-        print(f"  Ports: {[s for s in entities['sensors'] if any(p in s for p in ['acOut', 'acIn', 'usbOut', 'v12Out'])][:5]}")
+        print(f"  Ports: {[s for s in entities['sensors'] if s.startswith(_PORT_NAMES)][:5]}")
         print(f"  Controls: {list(entities['controls'])[:5]}")
     
     else:
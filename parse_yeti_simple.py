@@ -6,80 +6,104 @@ Simple and accurate Yeti 500 protocol parser focused on complete messages.
 import csv
 import json
 import re
-from typing import Dict, List, Any
-from collections import defaultdict
+from typing import Deque, Dict, List, Any, Pattern
+from collections import defaultdict, deque
 
-def decode_ascii_hex(hex_string: str) -> str:
-    """Convert colon-separated ASCII hex values to readable text."""
-    if not hex_string:
-        return ""
-    
-    hex_string = hex_string.strip('"')
-    parts = hex_string.split(':')
-    result = ""
-    
-    for part in parts:
-        if len(part) == 1:
-            result += part
-        elif len(part) == 2:
-            try:
-                byte_val = int(part, 16)
-                if 32 <= byte_val <= 126:
-                    result += chr(byte_val)
-                else:
-                    result += f"[{part}]"
-            except ValueError:
-                result += part
-        else:
-            result += part
-    
-    return result
+from yeti_capture import decode_ascii_hex
+
+# Characters that can start a JSON value; a key followed by one lost its colon
+_VALUE_START = frozenset('"{[-0123456789tfn')
+
+# Compiled once at import; these run for every large response
+_ID_RE = re.compile(r'"id"\s*:\s*(\d+)')
+_METHOD_RE = re.compile(r'"method"\s*:\s*"([^"]+)"')
+_SRC_RE = re.compile(r'"src"\s*:\s*"([^"]+)"')
+_FW_RE = re.compile(r'"fw"\s*:\s*"([^"]+)"')
+_SN_RE = re.compile(r'"sn"\s*:\s*"([^"]+)"')
+
+_BATTERY_PATTERNS: Dict[str, Pattern[str]] = {
+    field: re.compile(pattern) for field, pattern in {
+        'soc': r'"soc"\s*:\s*(\d+)',
+        'whRem': r'"whRem"\s*:\s*(\d+)',
+        'v': r'"v"\s*:\s*([\d.]+)',
+        'cyc': r'"cyc"\s*:\s*(\d+)',
+        'cTmp': r'"cTmp"\s*:\s*([\d.]+)',
+        'whIn': r'"whIn"\s*:\s*(\d+)',
+        'whOut': r'"whOut"\s*:\s*(\d+)',
+        'aNetAvg': r'"aNetAvg"\s*:\s*([\d.]+)',
+        'aNet': r'"aNet"\s*:\s*([\d.]+)',
+        'wNetAvg': r'"wNetAvg"\s*:\s*(\d+)',
+        'wNet': r'"wNet"\s*:\s*(\d+)',
+        'mTtef': r'"mTtef"\s*:\s*(\d+)',
+        'pctHtsRh': r'"pctHtsRh"\s*:\s*(\d+)',
+        'cHtsTmp': r'"cHtsTmp"\s*:\s*([\d.]+)',
+    }.items()
+}
+
+_AC_OUT_RE = re.compile(r'"acOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)')
+_AC_IN_RE = re.compile(r'"acIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)[^}]*"fastChg"\s*:\s*(\d+)')
+_V12_OUT_RE = re.compile(r'"v12Out"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)')
+_USB_OUT_RE = re.compile(r'"usbOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)')
+_LV_DC_IN_RE = re.compile(r'"lvDcIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)')
+_CHARGE_PROFILE_RE = re.compile(r'"chgPrfl"\s*:\s*\{[^}]*"min"\s*:\s*(\d+)[^}]*"max"\s*:\s*(\d+)[^}]*"rchg"\s*:\s*(\d+)')
+_DISPLAY_RE = re.compile(r'"dsp"\s*:\s*\{[^}]*"blkOut"\s*:\s*(\d+)[^}]*"brt"\s*:\s*(\d+)')
+
+# Plain brace depth; the capture's lossy quoting makes string tracking unreliable
+_BRACE_RE = re.compile(r'[{}]')
 
 def simple_parse_csv(csv_file: str) -> List[Dict[str, Any]]:
     """Simple parsing focused on complete message reconstruction."""
     print("📖 Simple parsing for complete messages...")
     
-    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
     # Find all the large response messages by looking for multi-line 0x0003 sequences
     large_messages = []
     
-    i = 0
-    while i < len(rows):
-        row = rows[i]
-        
-        # Look for 0x0008 length prefix
-        if row['handle'] == '0x0008':
+    # Rows are streamed; the deque holds the one row the inner loop reads past
+    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+        rows = iter(csv.DictReader(f))
+        pending: Deque[Dict[str, Any]] = deque()
+        
+        i = 0
+        while True:
+            row = pending.popleft() if pending else next(rows, None)
+            if row is None:
+                break
+            
+            # Look for 0x0008 length prefix
+            if row['handle'] != '0x0008':
+                i += 1
+                continue
+            
             length_hex = row['value'].split(':')[-1]
             try:
                 expected_length = int(length_hex, 16)
-                
-                # Collect all 0x0003 data that follows
-                all_text = ""
-                j = i + 1
-                
-                while j < len(rows) and rows[j]['handle'] == '0x0003':
-                    decoded = decode_ascii_hex(rows[j]['value'])
-                    all_text += decoded
-                    j += 1
-                
-                if len(all_text) > 50:  # Only large messages
-                    large_messages.append({
-                        'start_row': i + 1,
-                        'end_row': j,
-                        'expected_length': expected_length,
-                        'text': all_text,
-                        'actual_length': len(all_text)
-                    })
-                    print(f"Row {i+1}: Large message found - {len(all_text)} chars")
-                
-                i = j
             except ValueError:
                 i += 1
-        else:
-            i += 1
+                continue
+            
+            # Collect all 0x0003 data that follows
+            fragments = []
+            j = i + 1
+            
+            while (data_row := next(rows, None)) is not None:
+                if data_row['handle'] != '0x0003':
+                    pending.appendleft(data_row)
+                    break
+                fragments.append(decode_ascii_hex(data_row['value']))
+                j += 1
+            
+            all_text = ''.join(fragments)
+            if len(all_text) > 50:  # Only large messages
+                large_messages.append({
+                    'start_row': i + 1,
+                    'end_row': j,
+                    'expected_length': expected_length,
+                    'text': all_text,
+                    'actual_length': len(all_text)
+                })
+                print(f"Row {i+1}: Large message found - {len(all_text)} chars")
+            
+            i = j
     
     return large_messages
 
@@ -92,23 +116,11 @@ def extract_complete_json_responses(large_messages: List[Dict[str, Any]]) -> Lis
         
         # Look for complete JSON responses (they contain "result" and have proper structure)
         if '"result"' in text and '"body"' in text:
-            # Try to extract the complete JSON response
-            # Find the outermost { } pair
-            brace_count = 0
             start_pos = text.find('{')
             if start_pos != -1:
-                json_end = start_pos
-                for i, char in enumerate(text[start_pos:], start_pos):
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i
-                            break
-                
-                if brace_count == 0:
-                    json_str = text[start_pos:json_end + 1]
+                json_end = _match_braces(text, start_pos)
+                if json_end != -1:
+                    json_str = text[start_pos:json_end]
                     
                     # Parse this large response
                     parsed = parse_large_response(json_str)
@@ -123,40 +135,88 @@ def extract_complete_json_responses(large_messages: List[Dict[str, Any]]) -> Lis
     
     return responses
 
+def _match_braces(text: str, start_pos: int) -> int:
+    """Return the offset just past the object opened at start_pos, or -1 if it never closes."""
+    brace_count = 0
+    for token in _BRACE_RE.finditer(text, start_pos):
+        char = token.group()
+        if char == '{':
+            brace_count += 1
+        elif char == '}':
+            brace_count -= 1
+            if brace_count == 0:
+                return token.end()
+    return -1
+
+def _repair_json(text: str) -> str:
+    """Insert the colons missing after object keys in one quote-aware pass."""
+    out: List[str] = []
+    stack: List[str] = []   # open containers outside strings
+    n = len(text)
+    copied = 0              # text[:copied] is already in out
+    seg_start = 0           # start of the non-string run before the next quote
+    prev = ''               # last significant character outside strings
+    i = text.find('"')
+    while i != -1:
+        for ch in text[seg_start:i]:
+            if ch == '{' or ch == '[':
+                stack.append(ch)
+            elif (ch == '}' or ch == ']') and stack:
+                stack.pop()
+            if not ch.isspace():
+                prev = ch
+        is_key = (prev == '{' or prev == ',') and bool(stack) and stack[-1] == '{'
+        
+        # Closing quote, skipping backslash-escaped ones
+        j = text.find('"', i + 1)
+        while j != -1:
+            k = j - 1
+            while text[k] == '\\':
+                k -= 1
+            if (j - k) % 2:
+                break
+            j = text.find('"', j + 1)
+        if j == -1:
+            break  # Unterminated string: copy the rest as-is
+        
+        if is_key:
+            k = j + 1
+            while k < n and text[k].isspace():
+                k += 1
+            if k < n and text[k] in _VALUE_START:
+                out.append(text[copied:j + 1])
+                out.append(':')
+                copied = j + 1
+        
+        prev = '"'
+        seg_start = j + 1
+        i = text.find('"', seg_start)
+    
+    out.append(text[copied:])
+    return ''.join(out)
+
 def parse_large_response(json_str: str) -> Dict[str, Any] | None:
     """Parse a large JSON response to extract all entity data."""
     try:
         # Clean up the malformed JSON
         # The main issue is missing colons after field names
-        
-        # Step 1: Add colons where missing between quoted fields and values
-        # Pattern: "field"value -> "field":value
-        cleaned = re.sub(r'"([^"]+)"([^":{}\[\],\s])', r'"\1":\2', json_str)
-        
-        # Step 2: Fix quoted string patterns: "field""value" -> "field":"value"
-        cleaned = re.sub(r'"([^"]+)""([^"]*)"', r'"\1":"\2"', cleaned)
-        
-        # Step 3: Fix array/object patterns: "field"[...] or "field"{...}
-        cleaned = re.sub(r'"([^"]+)"(\[|\{)', r'"\1":\2', cleaned)
-        
-        # Step 4: Clean up multiple colons
-        cleaned = re.sub(r'::+', ':', cleaned)
+        cleaned = _repair_json(json_str)
         
         # Manual extraction since JSON parsing might still fail
         data: Dict[str, Any] = {'type': 'response'}
         
         # Extract ID
-        id_match = re.search(r'"id"\s*:\s*(\d+)', cleaned)
+        id_match = _ID_RE.search(cleaned)
         if id_match:
             data['id'] = int(id_match.group(1))
         
         # Extract method (sometimes in original request context)
-        method_match = re.search(r'"method"\s*:\s*"([^"]+)"', cleaned)
+        method_match = _METHOD_RE.search(cleaned)
         if method_match:
             data['method'] = method_match.group(1)
         
         # Extract src
-        src_match = re.search(r'"src"\s*:\s*"([^"]+)"', cleaned)
+        src_match = _SRC_RE.search(cleaned)
         if src_match:
             data['src'] = src_match.group(1)
         
@@ -164,35 +224,18 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
         result_data = {}
         
         # Device info
-        fw_match = re.search(r'"fw"\s*:\s*"([^"]+)"', cleaned)
+        fw_match = _FW_RE.search(cleaned)
         if fw_match:
             result_data['firmware'] = fw_match.group(1)
         
-        sn_match = re.search(r'"sn"\s*:\s*"([^"]+)"', cleaned)
+        sn_match = _SN_RE.search(cleaned)
         if sn_match:
             result_data['serial_number'] = sn_match.group(1)
         
         # Battery data (comprehensive)
         battery_data = {}
-        battery_patterns = {
-            'soc': r'"soc"\s*:\s*(\d+)',
-            'whRem': r'"whRem"\s*:\s*(\d+)', 
-            'v': r'"v"\s*:\s*([\d.]+)',
-            'cyc': r'"cyc"\s*:\s*(\d+)',
-            'cTmp': r'"cTmp"\s*:\s*([\d.]+)',
-            'whIn': r'"whIn"\s*:\s*(\d+)',
-            'whOut': r'"whOut"\s*:\s*(\d+)',
-            'aNetAvg': r'"aNetAvg"\s*:\s*([\d.]+)',
-            'aNet': r'"aNet"\s*:\s*([\d.]+)',
-            'wNetAvg': r'"wNetAvg"\s*:\s*(\d+)',
-            'wNet': r'"wNet"\s*:\s*(\d+)',
-            'mTtef': r'"mTtef"\s*:\s*(\d+)',
-            'pctHtsRh': r'"pctHtsRh"\s*:\s*(\d+)',
-            'cHtsTmp': r'"cHtsTmp"\s*:\s*([\d.]+)',
-        }
-        
-        for field, pattern in battery_patterns.items():
-            match = re.search(pattern, cleaned)
+        for field, pattern in _BATTERY_PATTERNS.items():
+            match = pattern.search(cleaned)
             if match:
                 value = match.group(1)
                 battery_data[field] = float(value) if '.' in value else int(value)
@@ -204,7 +247,7 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
         ports_data = {}
         
         # AC Output
-        ac_out_match = re.search(r'"acOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)', cleaned)
+        ac_out_match = _AC_OUT_RE.search(cleaned)
         if ac_out_match:
             ports_data['acOut'] = {
                 'status': int(ac_out_match.group(1)),
@@ -214,7 +257,7 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
             }
         
         # AC Input  
-        ac_in_match = re.search(r'"acIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)[^}]*"fastChg"\s*:\s*(\d+)', cleaned)
+        ac_in_match = _AC_IN_RE.search(cleaned)
         if ac_in_match:
             ports_data['acIn'] = {
                 'status': int(ac_in_match.group(1)),
@@ -225,7 +268,7 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
             }
         
         # 12V Output
-        v12_out_match = re.search(r'"v12Out"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)', cleaned)
+        v12_out_match = _V12_OUT_RE.search(cleaned)
         if v12_out_match:
             ports_data['v12Out'] = {
                 'status': int(v12_out_match.group(1)),
@@ -233,7 +276,7 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
             }
         
         # USB Output
-        usb_out_match = re.search(r'"usbOut"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"w"\s*:\s*(\d+)', cleaned)
+        usb_out_match = _USB_OUT_RE.search(cleaned)
         if usb_out_match:
             ports_data['usbOut'] = {
                 'status': int(usb_out_match.group(1)),
@@ -241,7 +284,7 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
             }
         
         # Low Voltage DC Input
-        lv_dc_in_match = re.search(r'"lvDcIn"\s*:\s*\{[^}]*"s"\s*:\s*(\d+)[^}]*"v"\s*:\s*(\d+)[^}]*"a"\s*:\s*([\d.]+)[^}]*"w"\s*:\s*(\d+)', cleaned)
+        lv_dc_in_match = _LV_DC_IN_RE.search(cleaned)
         if lv_dc_in_match:
             ports_data['lvDcIn'] = {
                 'status': int(lv_dc_in_match.group(1)),
@@ -255,7 +298,7 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
         
         # Charge profile
         charge_profile = {}
-        chg_profile_match = re.search(r'"chgPrfl"\s*:\s*\{[^}]*"min"\s*:\s*(\d+)[^}]*"max"\s*:\s*(\d+)[^}]*"rchg"\s*:\s*(\d+)', cleaned)
+        chg_profile_match = _CHARGE_PROFILE_RE.search(cleaned)
         if chg_profile_match:
             charge_profile = {
                 'min': int(chg_profile_match.group(1)),
@@ -265,7 +308,7 @@ def parse_large_response(json_str: str) -> Dict[str, Any] | None:
             result_data['charge_profile'] = charge_profile
         
         # Display settings
-        display_match = re.search(r'"dsp"\s*:\s*\{[^}]*"blkOut"\s*:\s*(\d+)[^}]*"brt"\s*:\s*(\d+)', cleaned)
+        display_match = _DISPLAY_RE.search(cleaned)
         if display_match:
             result_data['display'] = {
                 'blackout_time': int(display_match.group(1)),
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Regression test for the Yeti 500 JSON splitter in extract_yeti_json.py.
+Runs against the bundled Wireshark capture without Home Assistant dependencies.
+"""
+
+import csv
+import os
+
+from extract_yeti_json import clean_ascii_string, take_json_objects
+
+CAPTURE = os.path.join(os.path.dirname(__file__), 'testing', 'Wireshark_filtered_export_ascii_converted.csv')
+
+def test_take_json_objects_on_capture():
+    """Every {"id" message in the capture comes out as its own object."""
+    print("=== Testing JSON splitting on the bundled capture ===")
+    
+    handle_texts = {}
+    with open(CAPTURE, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            handle_texts.setdefault(row['handle'], []).append(clean_ascii_string(row['value']))
+    
+    message_count = 0
+    objects = []
+    for texts in handle_texts.values():
+        combined = ''.join(texts)
+        message_count += combined.count('{"id"')
+        
+        # Feed the text in row-sized pieces, as the extractor does
+        buffered = ''
+        for text in texts:
+            buffered += text
+            found, rest = take_json_objects(buffered)
+            objects.extend(found)
+            buffered = buffered[rest:]
+        objects.extend(take_json_objects(buffered, eof=True)[0])
+    
+    print(f"Messages: {message_count}, objects: {len(objects)}")
+    assert message_count == 46
+    assert len(objects) == message_count
+    assert all(obj.count('{"id"') == 1 for obj in objects)
+    print("✅ Each message is split out on its own")
+
+if __name__ == "__main__":
+    test_take_json_objects_on_capture()
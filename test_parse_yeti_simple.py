@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Regression test for response extraction in parse_yeti_simple.py.
+Runs against the bundled Wireshark capture without Home Assistant dependencies.
+"""
+
+import csv
+import os
+
+from parse_yeti_simple import decode_ascii_hex, extract_complete_json_responses
+
+CAPTURE = os.path.join(os.path.dirname(__file__), 'testing', 'Wireshark_filtered_decode.csv')
+
+def test_extract_lossy_lifetime_response():
+    """The lifetime response is extracted whole despite its unbalanced quotes."""
+    print("=== Testing extraction of the lifetime response ===")
+    
+    with open(CAPTURE, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    
+    # The response fragments follow the 0x0005 acknowledgement of request id 5
+    start = next(i for i, row in enumerate(rows) if row['value'].startswith('{:":i:d:":::5:,:":s:r:c'))
+    fragments = []
+    for row in rows[start:]:
+        if row['handle'] != '0x0003':
+            break
+        fragments.append(decode_ascii_hex(row['value']))
+    text = ''.join(fragments)
+    
+    # The capture dropped the quote before this key, so string tracking would drift
+    assert ',ocp"0}' in text
+    
+    responses = extract_complete_json_responses([{'start_row': start + 1, 'text': text}])
+    
+    print(f"Responses: {len(responses)}")
+    assert len(responses) == 1
+    assert responses[0]['parsed']['id'] == 5
+    assert responses[0]['raw_json'] == text[text.find('{'):text.rfind('}') + 1]
+    print("✅ Lifetime response extracted")
+
+if __name__ == "__main__":
+    test_extract_lossy_lifetime_response()
@@ -1,5 +1,7 @@
 import asyncio
-from bleak import BleakClient, BleakScanner
+from bleak import BleakClient
+
+from goalzero_scan import find_device_by_name
 
 # Goal Zero device configuration
 DEVICE_NAME = "gzf1-80-F14D2A"
@@ -12,22 +14,6 @@ COMMAND2_PAYLOAD = "FEFE0405000205"
 response_count = 0
 responses = []
 
-async def find_device_by_name(device_name):
-    """Find device by exact name match"""
-    print(f"🔍 Scanning for device: {device_name}")
-    devices = await BleakScanner.discover(timeout=10.0)
-    
-    for device in devices:
-        if device.name == device_name:
-            print(f"✅ Found device: {device.name} ({device.address})")
-            return device.address
-    
-    print(f"❌ Device '{device_name}' not found")
-    print("Available devices:")
-    for device in devices:
-        print(f"  - {device.name or 'Unknown'} ({device.address})")
-    return None
-
 def notification_handler(sender, data):
     """Handle notifications from the device"""
     global response_count, responses
@@ -7,7 +7,9 @@ This version discovers GATT characteristics by properties instead of hardcoded h
 import asyncio
 import csv
 import datetime
-from bleak import BleakClient, BleakScanner
+from bleak import BleakClient
+
+from goalzero_scan import find_device_by_name
 
 # Goal Zero device configuration
 DEVICE_NAME = "gzf1-80-F14D2A"
@@ -18,22 +20,6 @@ response_count = 0
 responses = []
 csv_data = []
 
-async def find_device_by_name(device_name):
-    """Find device by exact name match"""
-    print(f"🔍 Scanning for device: {device_name}")
-    devices = await BleakScanner.discover(timeout=10.0)
-    
-    for device in devices:
-        if device.name == device_name:
-            print(f"✅ Found device: {device.name} ({device.address})")
-            return device.address
-    
-    print(f"❌ Device '{device_name}' not found")
-    print("Available devices:")
-    for device in devices:
-        print(f"  - {device.name or 'Unknown'} ({device.address})")
-    return None
-
 def notification_handler(sender, data):
     """Handle notifications from the device"""
     global response_count, responses
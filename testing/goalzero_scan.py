@@ -0,0 +1,36 @@
+"""
+Shared BLE scan helper for the Goal Zero testing scripts.
+"""
+
+import asyncio
+from bleak import BleakScanner
+
+async def find_device_by_name(device_name, timeouts=(3.0, 6.0, 10.0)):
+    """Find device by exact name match, widening the scan window after each miss"""
+    print(f"🔍 Scanning for device: {device_name}")
+    seen = {}
+    found = asyncio.Event()
+
+    def detection_callback(device, advertisement_data):
+        seen[device.address] = device
+        if device.name == device_name:
+            found.set()
+
+    for timeout in timeouts:
+        async with BleakScanner(detection_callback=detection_callback):
+            try:
+                await asyncio.wait_for(found.wait(), timeout=timeout)
+                break
+            except asyncio.TimeoutError:
+                print(f"⏳ Not seen within {timeout:.0f}s")
+    
+    for device in seen.values():
+        if device.name == device_name:
+            print(f"✅ Found device: {device.name} ({device.address})")
+            return device.address
+    
+    print(f"❌ Device '{device_name}' not found")
+    print("Available devices:")
+    for device in seen.values():
+        print(f"  - {device.name or 'Unknown'} ({device.address})")
+    return None
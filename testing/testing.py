@@ -1,4 +1,5 @@
 import asyncio
+from contextlib import asynccontextmanager
 from bleak import BleakClient, BleakScanner
 
 from dotenv import load_dotenv
@@ -38,38 +39,80 @@ async def find_goalzero_device(custom_name_pattern=None):
     
     return None
 
-async def discover_device_services(device_address):
+@asynccontextmanager
+async def _with_client(device_address, client=None):
+    """Yield a connected client, reusing `client` if one is already open"""
+    if client is not None:
+        yield client
+        return
+    async with BleakClient(device_address) as new_client:
+        yield new_client
+
+async def discover_device_services(device_address, client=None):
     """Discover and list all services and characteristics for a device"""
     print(f"\n� Discovering services and characteristics for {device_address}...")
     try:
-        async with BleakClient(device_address) as client:
+        async with _with_client(device_address, client) as client:
             print(f"✅ Connected to device!")
             
             services = client.services
             service_list = list(services.services.values())
-            print(f"\n📋 Found {len(service_list)} services:")
+            lines = [f"\n📋 Found {len(service_list)} services:"]
             
             for service in service_list:
-                print(f"\n🔧 Service: {service.uuid}")
-                print(f"   Description: {service.description}")
+                lines.append(f"\n🔧 Service: {service.uuid}")
+                lines.append(f"   Description: {service.description}")
                 
                 for char in service.characteristics:
                     properties = ", ".join(char.properties)
-                    print(f"   📡 Characteristic: {char.uuid}")
-                    print(f"      Properties: {properties}")
+                    lines.append(f"   📡 Characteristic: {char.uuid}")
+                    lines.append(f"      Properties: {properties}")
                     if char.description:
-                        print(f"      Description: {char.description}")
+                        lines.append(f"      Description: {char.description}")
                     
                     # List descriptors if any
-                    for descriptor in char.descriptors:
-                        print(f"      📝 Descriptor: {descriptor.uuid}")
+                    lines.extend(f"      📝 Descriptor: {descriptor.uuid}" for descriptor in char.descriptors)
             
+            # Emit the whole summary in one write
+            print("\n".join(lines))
             return services
             
     except Exception as e:
         print(f"❌ Failed to discover services: {str(e)}")
         return None
 
+async def discover_many(device_names, scan_timeout=10.0, max_connections=3):
+    """Resolve several devices in one scan, then discover their services concurrently"""
+    wanted = set(device_names)
+    resolved = {}
+    all_found = asyncio.Event()
+
+    def detection_callback(device, advertisement_data):
+        if device.name in wanted and device.name not in resolved:
+            resolved[device.name] = device
+            if len(resolved) == len(wanted):
+                all_found.set()
+
+    print(f"Scanning for {len(wanted)} device(s)...")
+    async with BleakScanner(detection_callback=detection_callback):
+        try:
+            await asyncio.wait_for(all_found.wait(), timeout=scan_timeout)
+        except asyncio.TimeoutError:
+            missing = sorted(wanted - resolved.keys())
+            print(f"❌ Not found: {', '.join(missing)}")
+
+    # Most adapters get unreliable beyond a handful of simultaneous links
+    connection_slots = asyncio.Semaphore(max_connections)
+
+    async def discover_one(device):
+        async with connection_slots:
+            return await discover_device_services(device)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = {name: tg.create_task(discover_one(device)) for name, device in resolved.items()}
+
+    return {name: task.result() for name, task in tasks.items()}
+
 async def send_command(client, hex_str):
     data = bytes.fromhex(hex_str)
     await client.write_gatt_char(CHAR_UUID, data)
@@ -151,21 +194,26 @@ async def main():
         print(f"✅ SUCCESS! Connected via: {successful_method}")
         print(f"📍 Device Address: {successful_address}")
         
-        # Discover services and characteristics
-        await discover_device_services(successful_address)
-        
-        # Ask user if they want to proceed with commands
-        print(f"\n❓ The current characteristic UUID is: {gz_uuid}")
-        print("❓ Would you like to proceed with Goal Zero commands using this UUID?")
-        print("   (Press Ctrl+C to stop or check the discovered characteristics above)")
-        
+        # One connection for both service discovery and the command run
         try:
-            # Proceed with the actual commands
-            print(f"\n🚀 Proceeding with Goal Zero commands...")
-            await run_goalzero_commands(successful_address)
+            async with _with_client(successful_address) as client:
+                # Discover services and characteristics
+                await discover_device_services(successful_address, client)
+                
+                # Ask user if they want to proceed with commands
+                print(f"\n❓ The current characteristic UUID is: {gz_uuid}")
+                print("❓ Would you like to proceed with Goal Zero commands using this UUID?")
+                print("   (Press Ctrl+C to stop or check the discovered characteristics above)")
+                
+                try:
+                    # Proceed with the actual commands
+                    print(f"\n🚀 Proceeding with Goal Zero commands...")
+                    await run_goalzero_commands(successful_address, client)
+                except Exception as e:
+                    print(f"❌ Command execution failed: {str(e)}")
+                    print("💡 Check the discovered characteristics above for the correct UUID")
         except Exception as e:
-            print(f"❌ Command execution failed: {str(e)}")
-            print("💡 Check the discovered characteristics above for the correct UUID")
+            print(f"❌ Failed to connect to {successful_address}: {str(e)}")
     else:
         print("❌ ALL CONNECTION METHODS FAILED")
         print("\n💡 Troubleshooting tips:")
@@ -176,11 +224,11 @@ async def main():
         print("   - goalzero_device_name (exact device name)")
         print("   - goalzero_char_uuid (required for commands)")
 
-async def run_goalzero_commands(device_address):
+async def run_goalzero_commands(device_address, client=None):
     """Run the actual Goal Zero commands once connected"""
     print(f"Connecting to device at {device_address} for command execution...")
     
-    async with BleakClient(device_address) as client:
+    async with _with_client(device_address, client) as client:
         await client.start_notify(CHAR_UUID, lambda _, d: parse_response(d))
 
         # Example command sequence
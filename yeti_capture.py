@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Yeti 500 Wireshark capture scripts.
+"""
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TypeVar
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+# Two-character hex token -> decoded text (printable char or "[xx]" marker),
+# covering every upper/lower-case spelling so the common case is one lookup
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+_HEX_LUT = {
+    hi + lo: chr(int(hi + lo, 16)) if 32 <= int(hi + lo, 16) <= 126 else f"[{hi}{lo}]"
+    for hi in _HEX_DIGITS
+    for lo in _HEX_DIGITS
+}
+
+# Compiled once at import; these run for every reconstructed message
+_BRACE_TOKEN_RE = re.compile(r'[{}"]')
+_FIX_GENERIC_RE = re.compile(r'"([^"]+)"(\d+|"[^"]*"|\{|\[)')
+
+# Non-printable bytes -> "[xx]" markers, for the bytes.fromhex fast path
+_PRINT_FILTER = {i: f"[{i:02x}]" for i in range(256) if not 32 <= i <= 126}
+
+def decode_hex_token(part: str) -> str:
+    """Decode one colon-separated token: a printable char, an "[xx]" marker, or the token itself."""
+    if len(part) == 2:
+        try:
+            byte_val = int(part, 16)
+        except ValueError:
+            return part
+        return chr(byte_val) if 32 <= byte_val <= 126 else f"[{part}]"
+    return part
+
+def _decode_hex_pairs(hex_string: str) -> Optional[str]:
+    """Decode a uniform lower-case "xx:xx:..." string in C; None if not uniform."""
+    compact = hex_string.replace(':', '')
+    if (
+        len(compact) * 3 != (len(hex_string) + 1) * 2
+        or hex_string[2::3].strip(':')
+        or not (compact.isascii() and compact.isalnum())
+        or not (compact.islower() or compact.isdigit())
+    ):
+        return None
+    try:
+        data = bytes.fromhex(compact)
+    except ValueError:
+        return None
+    return data.decode('latin-1').translate(_PRINT_FILTER)
+
+@lru_cache(maxsize=4096)
+def decode_ascii_hex(hex_string: str) -> str:
+    """Convert colon-separated ASCII hex values to readable text."""
+    if not hex_string:
+        return ""
+    
+    # Remove quotes that CSV might have added
+    hex_string = hex_string.strip('"')
+    
+    # Wireshark hex exports are uniform byte pairs; let bytes.fromhex do those
+    decoded = _decode_hex_pairs(hex_string)
+    if decoded is not None:
+        return decoded
+    
+    # Mixed-case or odd tokens: one table lookup per token
+    lut_get = _HEX_LUT.get
+    return "".join([lut_get(part) or decode_hex_token(part) for part in hex_string.split(':')])
+
+def fix_malformed_json(json_str: str) -> str:
+    """Fix the malformed JSON format used by Yeti devices."""
+    # The format has missing colons after field names
+    # Convert: "field"value to "field":value
+    fixed = _FIX_GENERIC_RE.sub(r'"\1":\2', json_str)
+    
+    # Fix some specific patterns
+    fixed = (
+        fixed.replace('"method""', '"method":"')
+        .replace('"src""', '"src":"')
+        .replace('"action""', '"action":"')
+    )
+    
+    return fixed
+
+class BraceScanner:
+    """Track brace depth across a message's fragments as they arrive."""
+    
+    def __init__(self) -> None:
+        self.offset = 0          # characters scanned so far
+        self.depth = 0
+        self.start = -1          # index of the outer opening brace
+        self.end = -1            # index of its matching closing brace
+        self.in_string = False
+        self.escaped = False     # string escape carried over a fragment boundary
+    
+    def feed(self, fragment: str) -> bool:
+        """Scan just the new fragment; return True once the outer object has closed."""
+        if self.end < 0:
+            self._scan(fragment)
+        self.offset += len(fragment)
+        return self.end >= 0
+    
+    def _scan(self, fragment: str) -> None:
+        search = _BRACE_TOKEN_RE.search
+        pos = -1
+        if self.in_string:
+            pos = self._skip_string(fragment, 0)
+            if pos < 0:
+                return
+        match = search(fragment, pos + 1)
+        while match:
+            pos = match.start()
+            char = fragment[pos]
+            if char == '"':
+                # Braces inside string literals don't count
+                if self.depth:
+                    pos = self._skip_string(fragment, pos + 1)
+                    if pos < 0:
+                        return
+            elif char == '{':
+                if not self.depth:
+                    self.start = self.offset + pos
+                self.depth += 1
+            elif self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    self.end = self.offset + pos
+                    return
+            match = search(fragment, pos + 1)
+    
+    def _skip_string(self, fragment: str, pos: int) -> int:
+        """Return the index of the closing quote, or -1 if the string runs on."""
+        escaped = self.escaped
+        for i in range(pos, len(fragment)):
+            if escaped:
+                escaped = False
+            elif fragment[i] == '\\':
+                escaped = True
+            elif fragment[i] == '"':
+                self.in_string = self.escaped = False
+                return i
+        self.in_string = True
+        self.escaped = escaped
+        return -1
+
+def map_in_batches(
+    fn: Callable[[_T], _R], items: Iterable[_T], workers: int = 1, batch_size: int = 256
+) -> Iterator[_R]:
+    """Yield fn(item) for each item in order, in a process pool when workers > 1.
+    
+    Items are pulled batch_size at a time, so a streaming source is never
+    read more than one batch ahead of the results.
+    """
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    
+    it = iter(items)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while batch := list(islice(it, batch_size)):
+            yield from executor.map(fn, batch, chunksize=max(1, batch_size // (workers * 4)))
+
+def _worker_count(value: str) -> int:
+    """argparse type for --workers: a positive integer."""
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid worker count: {value!r}") from None
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"worker count must be at least 1, got {workers}")
+    return workers
+
+def parse_cli_args(description: Optional[str], argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the --keep-raw and --workers options shared by the capture parsers."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        '--keep-raw', action='store_true',
+        help="include each message's JSON text in the output",
+    )
+    parser.add_argument(
+        '--workers', type=_worker_count, nargs='?', const=os.cpu_count() or 1, default=1, metavar='N',
+        help='parse messages in N worker processes (default: 1; bare --workers uses every CPU)',
+    )
+    return parser.parse_args(argv)